@@ -13,6 +13,7 @@ import logging
 import argparse
 import tempfile
 import shutil
+from functools import lru_cache
 from pathlib import Path
 
 from hyrise.utils.container_utils import (
@@ -98,8 +99,14 @@ def _resolve_output_json_path(output, fasta_files) -> str:
     return str(output_path.resolve())
 
 
+@lru_cache(maxsize=1)
 def _bundled_hivdb_xml_path() -> Path:
-    """Return the latest bundled HIVdb XML path shipped with HyRISE."""
+    """
+    Return the latest bundled HIVdb XML path shipped with HyRISE.
+
+    The package data does not change while the process runs, so the directory
+    scan is done once and the result is cached.
+    """
     package_root = Path(__file__).resolve().parent.parent
     bundled_xml_files = list(package_root.glob("HIVDB_*.xml"))
     latest = select_latest_hivdb_xml(bundled_xml_files)
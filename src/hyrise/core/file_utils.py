@@ -5,6 +5,12 @@ File handling utilities for HyRISE package
 import os
 import json
 
+# Shared encoder for the _mqc.json tables: compact separators and raw UTF-8
+# keep the files small, and the tables are plain trees with no cycles to guard
+_JSON_ENCODER = json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False, check_circular=False
+)
+
 
 def extract_sample_id(filename):
     """
@@ -48,6 +54,32 @@ def load_json_file(json_file, preserve_list=True):
     return data
 
 
+def write_json_file(json_file, data):
+    """
+    Serialize data as compact UTF-8 JSON and write it in a single call
+
+    Args:
+        json_file (str): Path to the output JSON file
+        data (dict or list): JSON-serializable data to write
+    """
+    encoded = _JSON_ENCODER.encode(data).encode("utf-8")
+    with open(json_file, "wb") as f:
+        f.write(encoded)
+
+
+def write_html_file(html_file, html_content):
+    """
+    Encode HTML as UTF-8 and write it in a single call
+
+    Args:
+        html_file (str): Path to the output HTML file
+        html_content (str): HTML to write
+    """
+    encoded = html_content.encode("utf-8")
+    with open(html_file, "wb") as f:
+        f.write(encoded)
+
+
 # hyrise/utils/html_utils.py
 """
 HTML generation utilities for HyRISE package
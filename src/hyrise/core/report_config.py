@@ -11,6 +11,7 @@ import argparse
 import subprocess
 import yaml
 import base64
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Tuple, Optional, Union
@@ -18,6 +19,30 @@ from bs4 import BeautifulSoup, Comment
 from rich.console import Console
 from hyrise import __version__
 
+# Version strings in the MultiQC report that are rewritten to the HyRISE version
+VERSION_TAG_PATTERN = re.compile(r"\bv\d+\.\d+(\.\d+)?")
+VERSION_NUMBER_PATTERN = re.compile(r"\d+\.\d+(\.\d+)?")
+
+
+@lru_cache(maxsize=8)
+def _encode_logo(path: str, mtime_ns: int, size: int) -> str:
+    """
+    Read and base64-encode a logo file.
+
+    The modification time and size are part of the cache key, so a logo that
+    is rewritten in place is encoded again rather than served stale.
+
+    Args:
+        path: Path to the logo file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        str: Base64-encoded file content
+    """
+    with open(path, "rb") as image_file:
+        return base64.b64encode(image_file.read()).decode("utf-8")
+
 
 class HyRISEReportGenerator:
     """Class to handle the generation and customization of MultiQC reports for HyRISE."""
@@ -110,8 +135,9 @@ class HyRISEReportGenerator:
             return ""
 
         # Log file details
+        logo_stat = resolved_path.stat()
         self.logger.info(
-            f"Found logo file: {resolved_path} ({resolved_path.stat().st_size} bytes)"
+            f"Found logo file: {resolved_path} ({logo_stat.st_size} bytes)"
         )
 
         # Validate file extension
@@ -122,11 +148,11 @@ class HyRISEReportGenerator:
             return ""
 
         try:
-            # Encode image as base64
-            with open(resolved_path, "rb") as image_file:
-                file_content = image_file.read()
-                self.logger.info(f"Read {len(file_content)} bytes from logo file")
-                encoded_string = base64.b64encode(file_content).decode("utf-8")
+            # Encode image as base64, reusing the result for an unchanged file
+            encoded_string = _encode_logo(
+                str(resolved_path), logo_stat.st_mtime_ns, logo_stat.st_size
+            )
+            self.logger.info(f"Encoded {logo_stat.st_size} bytes from logo file")
 
             # Create data URI for embedding
             if resolved_path.suffix.lower() == ".svg":
@@ -1001,35 +1027,20 @@ class HyRISEReportGenerator:
         try:
             self.logger.info(f"Starting HTML modifications on {html_path}")
 
-            # Track modifications for reporting
-            modifications = {
-                "logo": False,
-                "title": False,
-                "footer": False,
-                "about_section": False,
-                "toolbox": False,
-                "favicon": False,
-                "welcome": False,
-                "citations": False,
-                "navbar_version": False,
-                "meta_tags": False,
-                "lead_paragraph": False,
-                "links": False,
-            }
-
-            # Read and parse the HTML file
+            # Read the HTML file and apply the HyRISE customizations in memory
             try:
                 with open(html_path, "r", encoding="utf-8") as html_file:
                     html_content = html_file.read()
 
-                # Parse with appropriate parser
-                soup = BeautifulSoup(html_content, "html.parser")
-                self.logger.info("Successfully parsed HTML document")
+                html_content, modifications = self.modify_html_content(
+                    html_content, logo_data_uri
+                )
             except Exception as e:
                 self.logger.error(f"Failed to read or parse HTML file: {str(e)}")
                 return False, {}
 
-            # Initialize a backup in case restoration is needed
+            # Initialize a backup in case restoration is needed; the file on
+            # disk is still the original at this point
             try:
                 backup_path = f"{html_path}.backup"
                 shutil.copy2(html_path, backup_path)
@@ -1037,407 +1048,501 @@ class HyRISEReportGenerator:
             except Exception as e:
                 self.logger.warning(f"Could not create backup: {str(e)}")
 
-            # 1. MODIFY PAGE TITLE
+            # Write the updated HTML back to the file
             try:
-                title_tag = soup.find("title")
-                if title_tag:
-                    original_title = title_tag.string
-                    if "MultiQC" in original_title:
-                        new_title = original_title.replace("MultiQC", "HyRISE")
-                        title_tag.string = new_title
-                    else:
-                        title_tag.string = (
-                            "HyRISE: HIV Resistance Interpretation & Scoring Engine"
-                        )
+                with open(html_path, "w", encoding="utf-8") as file:
+                    file.write(html_content)
 
-                    modifications["title"] = True
-                    self.logger.info(f"Updated page title: {title_tag.string}")
+                # Log successful modifications
+                modified_items = [k for k, v in modifications.items() if v]
+                self.logger.info(
+                    f"HTML modifications completed successfully. Modified: {', '.join(modified_items)}"
+                )
+
+                return True, modifications
             except Exception as e:
-                self.logger.error(f"Error updating page title: {str(e)}")
+                self.logger.error(f"Error writing modified HTML: {str(e)}")
+                # Try to restore from backup
+                try:
+                    if os.path.exists(f"{html_path}.backup"):
+                        shutil.copy2(f"{html_path}.backup", html_path)
+                        self.logger.info("Restored HTML from backup after write error")
+                except Exception:
+                    self.logger.error("Failed to restore from backup")
 
-            # 2. REPLACE META TAGS
-            try:
-                meta_tags_modified = False
-                meta_updates = {
-                    "description": "HyRISE: HIV Resistance Interpretation & Scoring Engine report summarizing HIV drug resistance mutations and clinical interpretation",
-                    "author": "National Microbiology Laboratory, Public Health Agency of Canada",
-                    "keywords": "HIV, drug resistance, mutation analysis, antiretroviral therapy",
-                }
+                return False, {}
 
-                for meta in soup.find_all("meta"):
-                    if meta.get("name") in meta_updates:
-                        meta["content"] = meta_updates[meta.get("name")]
-                        meta_tags_modified = True
-                    elif meta.get("property") == "og:description":
-                        meta["content"] = meta_updates["description"]
-                        meta_tags_modified = True
-                    elif meta.get("property") == "og:title" and "MultiQC" in meta.get(
-                        "content", ""
-                    ):
-                        meta["content"] = meta["content"].replace("MultiQC", "HyRISE")
+        except Exception as e:
+            self.logger.error(f"Unexpected error in HTML modification: {str(e)}")
+            import traceback
+
+            self.logger.error(traceback.format_exc())
+            return False, {}
+
+    def modify_html_content(
+        self, html_content: str, logo_data_uri: str = ""
+    ) -> Tuple[str, Dict[str, bool]]:
+        """
+        Apply the HyRISE customizations to MultiQC report HTML held in memory.
+
+        This is the transformation behind modify_html, without the file reading,
+        backup and writing, so callers that already hold the HTML can skip the
+        disk round-trips.
+
+        Args:
+            html_content: HTML of the MultiQC report
+            logo_data_uri: Data URI for the HyRISE logo
+
+        Returns:
+            Tuple of (modified_html, modifications_made)
+        """
+        # Track modifications for reporting
+        modifications = {
+            "logo": False,
+            "title": False,
+            "footer": False,
+            "about_section": False,
+            "toolbox": False,
+            "favicon": False,
+            "welcome": False,
+            "citations": False,
+            "navbar_version": False,
+            "meta_tags": False,
+            "lead_paragraph": False,
+            "links": False,
+        }
+
+        # Parse with appropriate parser
+        soup = BeautifulSoup(html_content, "html.parser")
+        self.logger.info("Successfully parsed HTML document")
+
+        # 1. MODIFY PAGE TITLE
+        try:
+            title_tag = soup.find("title")
+            if title_tag:
+                original_title = title_tag.string
+                if "MultiQC" in original_title:
+                    new_title = original_title.replace("MultiQC", "HyRISE")
+                    title_tag.string = new_title
+                else:
+                    title_tag.string = (
+                        "HyRISE: HIV Resistance Interpretation & Scoring Engine"
+                    )
+
+                modifications["title"] = True
+                self.logger.info(f"Updated page title: {title_tag.string}")
+        except Exception as e:
+            self.logger.error(f"Error updating page title: {str(e)}")
+
+        # 2. REPLACE META TAGS
+        try:
+            meta_tags_modified = False
+            meta_updates = {
+                "description": "HyRISE: HIV Resistance Interpretation & Scoring Engine report summarizing HIV drug resistance mutations and clinical interpretation",
+                "author": "National Microbiology Laboratory, Public Health Agency of Canada",
+                "keywords": "HIV, drug resistance, mutation analysis, antiretroviral therapy",
+            }
+
+            for meta in soup.find_all("meta"):
+                if meta.get("name") in meta_updates:
+                    meta["content"] = meta_updates[meta.get("name")]
+                    meta_tags_modified = True
+                elif meta.get("property") == "og:description":
+                    meta["content"] = meta_updates["description"]
+                    meta_tags_modified = True
+                elif meta.get("property") == "og:title" and "MultiQC" in meta.get(
+                    "content", ""
+                ):
+                    meta["content"] = meta["content"].replace("MultiQC", "HyRISE")
+                    meta_tags_modified = True
+
+            # Add missing meta tags
+            head_tag = soup.find("head")
+            if head_tag:
+                for name, content in meta_updates.items():
+                    if not soup.find("meta", attrs={"name": name}):
+                        new_meta = soup.new_tag("meta")
+                        new_meta["name"] = name
+                        new_meta["content"] = content
+                        head_tag.append(new_meta)
                         meta_tags_modified = True
 
-                # Add missing meta tags
+            modifications["meta_tags"] = meta_tags_modified
+            if meta_tags_modified:
+                self.logger.info(
+                    "Updated meta tags for improved SEO and attribution"
+                )
+        except Exception as e:
+            self.logger.error(f"Error updating meta tags: {str(e)}")
+
+        # 3. ADD FAVICON
+        try:
+            # Find favicon file with multiple fallbacks
+            favicon_paths = [
+                Path("src/hyrise/core/assets/favicon.svg"),
+                Path(__file__).parent / "assets" / "favicon.svg",
+                Path(__file__).parent.parent / "assets" / "favicon.svg",
+                Path(os.path.dirname(os.path.abspath(__file__)))
+                / "assets"
+                / "favicon.svg",
+            ]
+
+            favicon_path = next((p for p in favicon_paths if p.exists()), None)
+            favicon_data_uri = ""
+
+            if favicon_path:
+                try:
+                    with open(favicon_path, "rb") as f:
+                        favicon_content = f.read()
+                        encoded_favicon = base64.b64encode(favicon_content).decode(
+                            "utf-8"
+                        )
+                        favicon_data_uri = (
+                            f"data:image/svg+xml;base64,{encoded_favicon}"
+                        )
+                    self.logger.info(f"Loaded favicon from {favicon_path}")
+                except Exception as e:
+                    self.logger.warning(f"Failed to load favicon file: {str(e)}")
+
+            # Fallback to logo if no favicon found
+            if not favicon_data_uri and logo_data_uri:
+                favicon_data_uri = logo_data_uri
+                self.logger.info("Using logo as favicon (fallback)")
+
+            if favicon_data_uri:
                 head_tag = soup.find("head")
                 if head_tag:
-                    for name, content in meta_updates.items():
-                        if not soup.find("meta", attrs={"name": name}):
-                            new_meta = soup.new_tag("meta")
-                            new_meta["name"] = name
-                            new_meta["content"] = content
-                            head_tag.append(new_meta)
-                            meta_tags_modified = True
-
-                modifications["meta_tags"] = meta_tags_modified
-                if meta_tags_modified:
-                    self.logger.info(
-                        "Updated meta tags for improved SEO and attribution"
+                    # Remove existing favicons
+                    for link in head_tag.find_all(
+                        "link", rel=lambda r: r and "icon" in r.lower()
+                    ):
+                        link.decompose()
+
+                    # Add new favicon
+                    new_favicon = soup.new_tag("link")
+                    new_favicon["rel"] = "icon"
+                    new_favicon["type"] = (
+                        "image/svg+xml"
+                        if "svg+xml" in favicon_data_uri
+                        else "image/png"
                     )
-            except Exception as e:
-                self.logger.error(f"Error updating meta tags: {str(e)}")
+                    new_favicon["href"] = favicon_data_uri
+                    head_tag.append(new_favicon)
 
-            # 3. ADD FAVICON
+                    modifications["favicon"] = True
+                    self.logger.info("Added custom favicon")
+            else:
+                self.logger.warning("No favicon source available")
+        except Exception as e:
+            self.logger.error(f"Error setting favicon: {str(e)}")
+
+        # 4. REPLACE LOGOS WITH MULTIPLE SELECTOR STRATEGIES
+        if logo_data_uri:
             try:
-                # Find favicon file with multiple fallbacks
-                favicon_paths = [
-                    Path("src/hyrise/core/assets/favicon.svg"),
-                    Path(__file__).parent / "assets" / "favicon.svg",
-                    Path(__file__).parent.parent / "assets" / "favicon.svg",
-                    Path(os.path.dirname(os.path.abspath(__file__)))
-                    / "assets"
-                    / "favicon.svg",
+                logo_replaced = False
+
+                # Strategy 0: Replace inline SVG-based MultiQC logos.
+                for svg_logo in soup.select(
+                    "svg.multiqc-logo, .side-nav-logo svg, .multiqc-logo-wrapper svg"
+                ):
+                    replacement_img = soup.new_tag("img")
+                    replacement_img["src"] = logo_data_uri
+                    replacement_img["alt"] = "HyRISE"
+                    replacement_img["class"] = ["custom_logo", "custom_logo_light"]
+                    # Match sizing to the container type:
+                    # - side nav logos should remain compact
+                    # - page-title/logo-wrapper should render at full report-logo size
+                    if svg_logo.find_parent(class_="side-nav-logo"):
+                        replacement_img["style"] = "max-height:36px; width:auto;"
+                    elif svg_logo.find_parent(class_="multiqc-logo-wrapper"):
+                        replacement_img["style"] = (
+                            "width:320px; max-width:100%; height:auto;"
+                        )
+                    svg_logo.replace_with(replacement_img)
+                    logo_replaced = True
+                    self.logger.info("Replaced inline SVG logo with custom logo image")
+
+                # Strategy 1: Use structured selectors with hierarchy
+                logo_hierarchies = [
+                    ("h1 > a > img", "Header logo in h1"),
+                    (".navbar-brand > img", "Navbar brand logo"),
+                    (".navbar-header > a > img", "Navbar header logo"),
+                    (".header-logo > img", "Header logo class"),
+                    (".logo-container img", "Logo container"),
                 ]
 
-                favicon_path = next((p for p in favicon_paths if p.exists()), None)
-                favicon_data_uri = ""
+                for selector, description in logo_hierarchies:
+                    logo_imgs = soup.select(selector)
+                    if logo_imgs:
+                        for img in logo_imgs:
+                            img["src"] = logo_data_uri
+                            if img.get("alt") and "MultiQC" in img["alt"]:
+                                img["alt"] = img["alt"].replace("MultiQC", "HyRISE")
+                            logo_replaced = True
+                            self.logger.info(f"Replaced logo: {description}")
+
+                # Strategy 2: Find logos by attribute patterns
+                if not logo_replaced:
+                    for img_tag in soup.find_all("img"):
+                        # Check for logos by source, alt text, or class
+                        img_src = img_tag.get("src", "")
+                        img_alt = img_tag.get("alt", "")
+                        img_class = " ".join(img_tag.get("class", []))
 
-                if favicon_path:
-                    try:
-                        with open(favicon_path, "rb") as f:
-                            favicon_content = f.read()
-                            encoded_favicon = base64.b64encode(favicon_content).decode(
-                                "utf-8"
-                            )
-                            favicon_data_uri = (
-                                f"data:image/svg+xml;base64,{encoded_favicon}"
-                            )
-                        self.logger.info(f"Loaded favicon from {favicon_path}")
-                    except Exception as e:
-                        self.logger.warning(f"Failed to load favicon file: {str(e)}")
-
-                # Fallback to logo if no favicon found
-                if not favicon_data_uri and logo_data_uri:
-                    favicon_data_uri = logo_data_uri
-                    self.logger.info("Using logo as favicon (fallback)")
-
-                if favicon_data_uri:
-                    head_tag = soup.find("head")
-                    if head_tag:
-                        # Remove existing favicons
-                        for link in head_tag.find_all(
-                            "link", rel=lambda r: r and "icon" in r.lower()
+                        if (
+                            "logo" in img_src.lower()
+                            or "MultiQC" in img_alt
+                            or "logo" in img_class.lower()
+                            or img_src.startswith("data:image/")
                         ):
-                            link.decompose()
-
-                        # Add new favicon
-                        new_favicon = soup.new_tag("link")
-                        new_favicon["rel"] = "icon"
-                        new_favicon["type"] = (
-                            "image/svg+xml"
-                            if "svg+xml" in favicon_data_uri
-                            else "image/png"
-                        )
-                        new_favicon["href"] = favicon_data_uri
-                        head_tag.append(new_favicon)
-
-                        modifications["favicon"] = True
-                        self.logger.info("Added custom favicon")
-                else:
-                    self.logger.warning("No favicon source available")
-            except Exception as e:
-                self.logger.error(f"Error setting favicon: {str(e)}")
-
-            # 4. REPLACE LOGOS WITH MULTIPLE SELECTOR STRATEGIES
-            if logo_data_uri:
-                try:
-                    logo_replaced = False
-
-                    # Strategy 0: Replace inline SVG-based MultiQC logos.
-                    for svg_logo in soup.select(
-                        "svg.multiqc-logo, .side-nav-logo svg, .multiqc-logo-wrapper svg"
-                    ):
-                        replacement_img = soup.new_tag("img")
-                        replacement_img["src"] = logo_data_uri
-                        replacement_img["alt"] = "HyRISE"
-                        replacement_img["class"] = ["custom_logo", "custom_logo_light"]
-                        # Match sizing to the container type:
-                        # - side nav logos should remain compact
-                        # - page-title/logo-wrapper should render at full report-logo size
-                        if svg_logo.find_parent(class_="side-nav-logo"):
-                            replacement_img["style"] = "max-height:36px; width:auto;"
-                        elif svg_logo.find_parent(class_="multiqc-logo-wrapper"):
-                            replacement_img["style"] = (
-                                "width:320px; max-width:100%; height:auto;"
-                            )
-                        svg_logo.replace_with(replacement_img)
-                        logo_replaced = True
-                        self.logger.info("Replaced inline SVG logo with custom logo image")
-
-                    # Strategy 1: Use structured selectors with hierarchy
-                    logo_hierarchies = [
-                        ("h1 > a > img", "Header logo in h1"),
-                        (".navbar-brand > img", "Navbar brand logo"),
-                        (".navbar-header > a > img", "Navbar header logo"),
-                        (".header-logo > img", "Header logo class"),
-                        (".logo-container img", "Logo container"),
+                            img_tag["src"] = logo_data_uri
+                            if "MultiQC" in img_alt:
+                                img_tag["alt"] = img_alt.replace(
+                                    "MultiQC", "HyRISE"
+                                )
+                            logo_replaced = True
+                            self.logger.info(f"Replaced logo by attribute pattern")
+
+                # Strategy 3: Look in specific containers
+                if not logo_replaced:
+                    containers = [
+                        ".navbar",
+                        ".navbar-header",
+                        "header",
+                        ".header",
+                        "#header",
+                        ".branding",
+                        ".brand",
                     ]
 
-                    for selector, description in logo_hierarchies:
-                        logo_imgs = soup.select(selector)
-                        if logo_imgs:
-                            for img in logo_imgs:
+                    for container in containers:
+                        elements = soup.select(container)
+                        for element in elements:
+                            for img in element.find_all("img"):
                                 img["src"] = logo_data_uri
-                                if img.get("alt") and "MultiQC" in img["alt"]:
-                                    img["alt"] = img["alt"].replace("MultiQC", "HyRISE")
                                 logo_replaced = True
-                                self.logger.info(f"Replaced logo: {description}")
-
-                    # Strategy 2: Find logos by attribute patterns
-                    if not logo_replaced:
-                        for img_tag in soup.find_all("img"):
-                            # Check for logos by source, alt text, or class
-                            img_src = img_tag.get("src", "")
-                            img_alt = img_tag.get("alt", "")
-                            img_class = " ".join(img_tag.get("class", []))
-
-                            if (
-                                "logo" in img_src.lower()
-                                or "MultiQC" in img_alt
-                                or "logo" in img_class.lower()
-                                or img_src.startswith("data:image/")
-                            ):
-                                img_tag["src"] = logo_data_uri
-                                if "MultiQC" in img_alt:
-                                    img_tag["alt"] = img_alt.replace(
-                                        "MultiQC", "HyRISE"
-                                    )
-                                logo_replaced = True
-                                self.logger.info(f"Replaced logo by attribute pattern")
-
-                    # Strategy 3: Look in specific containers
-                    if not logo_replaced:
-                        containers = [
-                            ".navbar",
-                            ".navbar-header",
-                            "header",
-                            ".header",
-                            "#header",
-                            ".branding",
-                            ".brand",
-                        ]
-
-                        for container in containers:
-                            elements = soup.select(container)
-                            for element in elements:
-                                for img in element.find_all("img"):
-                                    img["src"] = logo_data_uri
-                                    logo_replaced = True
-                                    self.logger.info(
-                                        f"Replaced logo in container: {container}"
-                                    )
-
-                    modifications["logo"] = logo_replaced
-                    if not logo_replaced:
-                        self.logger.warning("Could not find logos to replace")
-                except Exception as e:
-                    self.logger.error(f"Error replacing logos: {str(e)}")
+                                self.logger.info(
+                                    f"Replaced logo in container: {container}"
+                                )
 
-            # 5. UPDATE VERSION INFORMATION
-            try:
-                version_replaced = False
-
-                # Strategy 1: Look for version in small tags within h1
-                for h1 in soup.find_all("h1"):
-                    for small in h1.find_all("small"):
-                        text = small.get_text().strip()
-                        if text.startswith("v") or "version" in text.lower():
-                            small.string = f"v{self.version}"
-                            version_replaced = True
-                            self.logger.info(
-                                f"Updated version in header: {small.string}"
-                            )
+                modifications["logo"] = logo_replaced
+                if not logo_replaced:
+                    self.logger.warning("Could not find logos to replace")
+            except Exception as e:
+                self.logger.error(f"Error replacing logos: {str(e)}")
 
-                # Strategy 2: Look for version pattern in any text node
-                if not version_replaced:
-                    version_pattern = re.compile(r"\bv\d+\.\d+(\.\d+)?")
+        # 5. UPDATE VERSION INFORMATION
+        try:
+            version_replaced = False
+
+            # Strategy 1: Look for version in small tags within h1
+            for h1 in soup.find_all("h1"):
+                for small in h1.find_all("small"):
+                    text = small.get_text().strip()
+                    if text.startswith("v") or "version" in text.lower():
+                        small.string = f"v{self.version}"
+                        version_replaced = True
+                        self.logger.info(
+                            f"Updated version in header: {small.string}"
+                        )
+
+            # Strategy 2: Look for version pattern in any text node
+            if not version_replaced:
+                for text in soup.find_all(string=VERSION_TAG_PATTERN):
+                    if not isinstance(text, Comment):  # Skip comment nodes
+                        parent = text.parent
+                        new_text = VERSION_TAG_PATTERN.sub(f"v{self.version}", text)
+                        text.replace_with(new_text)
+                        version_replaced = True
+                        self.logger.info(
+                            f"Updated version text with pattern: {parent.name}"
+                        )
 
-                    for text in soup.find_all(string=version_pattern):
-                        if not isinstance(text, Comment):  # Skip comment nodes
-                            parent = text.parent
-                            new_text = version_pattern.sub(f"v{self.version}", text)
-                            text.replace_with(new_text)
+            # Strategy 3: Look for version in footer
+            if not version_replaced:
+                footer = soup.find("footer") or soup.find(class_="footer")
+                if footer:
+                    for p in footer.find_all("p"):
+                        if "version" in p.text.lower():
+                            # Replace just the version number, preserving the rest of the text
+                            text = p.get_text()
+                            new_text = VERSION_NUMBER_PATTERN.sub(self.version, text)
+                            p.string = new_text
                             version_replaced = True
-                            self.logger.info(
-                                f"Updated version text with pattern: {parent.name}"
-                            )
+                            self.logger.info(f"Updated version in footer")
 
-                # Strategy 3: Look for version in footer
-                if not version_replaced:
-                    footer = soup.find("footer") or soup.find(class_="footer")
-                    if footer:
-                        for p in footer.find_all("p"):
-                            if "version" in p.text.lower():
-                                # Replace just the version number, preserving the rest of the text
-                                text = p.get_text()
-                                new_text = re.sub(
-                                    r"\d+\.\d+(\.\d+)?", self.version, text
-                                )
-                                p.string = new_text
-                                version_replaced = True
-                                self.logger.info(f"Updated version in footer")
+            modifications["navbar_version"] = version_replaced
+        except Exception as e:
+            self.logger.error(f"Error updating version information: {str(e)}")
 
-                modifications["navbar_version"] = version_replaced
-            except Exception as e:
-                self.logger.error(f"Error updating version information: {str(e)}")
+        # 6. REMOVE LEAD PARAGRAPH ABOUT MULTIQC
+        try:
+            lead_removed = False
+            # Multiple strategies to find and remove the lead paragraph
+
+            # Strategy 1: Find by class and content
+            lead_paras = soup.find_all("p", class_="lead")
+            for para in lead_paras:
+                text = para.get_text().lower()
+                if any(
+                    phrase in text
+                    for phrase in ["multiqc", "aggregate results", "bioinformatics"]
+                ):
+                    para.decompose()
+                    lead_removed = True
+                    self.logger.info(
+                        "Removed MultiQC lead paragraph by class and content"
+                    )
 
-            # 6. REMOVE LEAD PARAGRAPH ABOUT MULTIQC
-            try:
-                lead_removed = False
-                # Multiple strategies to find and remove the lead paragraph
-
-                # Strategy 1: Find by class and content
-                lead_paras = soup.find_all("p", class_="lead")
-                for para in lead_paras:
-                    text = para.get_text().lower()
-                    if any(
-                        phrase in text
-                        for phrase in ["multiqc", "aggregate results", "bioinformatics"]
-                    ):
-                        para.decompose()
+            # Strategy 2: Find by content in any paragraph
+            if not lead_removed:
+                intro_phrases = [
+                    "multiqc is a",
+                    "multiqc generates",
+                    "modular tool to aggregate",
+                    "bioinformatics analyses",
+                ]
+
+                for p in soup.find_all("p"):
+                    text = p.get_text().lower()
+                    if any(phrase in text for phrase in intro_phrases):
+                        p.decompose()
                         lead_removed = True
                         self.logger.info(
-                            "Removed MultiQC lead paragraph by class and content"
+                            "Removed MultiQC description paragraph by content"
                         )
 
-                # Strategy 2: Find by content in any paragraph
-                if not lead_removed:
-                    intro_phrases = [
-                        "multiqc is a",
-                        "multiqc generates",
-                        "modular tool to aggregate",
-                        "bioinformatics analyses",
-                    ]
-
-                    for p in soup.find_all("p"):
-                        text = p.get_text().lower()
-                        if any(phrase in text for phrase in intro_phrases):
+            # Strategy 3: Find by location and basic structure
+            if not lead_removed:
+                # Look for paragraphs in the main content area that mention MultiQC
+                main_content = soup.find(id="mainContent") or soup.find(
+                    class_="mainpage"
+                )
+                if main_content:
+                    for p in main_content.find_all(
+                        "p", limit=3
+                    ):  # Check first few paragraphs
+                        if "MultiQC" in p.get_text():
                             p.decompose()
                             lead_removed = True
                             self.logger.info(
-                                "Removed MultiQC description paragraph by content"
+                                "Removed MultiQC paragraph from main content"
                             )
 
-                # Strategy 3: Find by location and basic structure
-                if not lead_removed:
-                    # Look for paragraphs in the main content area that mention MultiQC
-                    main_content = soup.find(id="mainContent") or soup.find(
-                        class_="mainpage"
-                    )
-                    if main_content:
-                        for p in main_content.find_all(
-                            "p", limit=3
-                        ):  # Check first few paragraphs
-                            if "MultiQC" in p.get_text():
-                                p.decompose()
-                                lead_removed = True
-                                self.logger.info(
-                                    "Removed MultiQC paragraph from main content"
-                                )
+            modifications["lead_paragraph"] = lead_removed
+        except Exception as e:
+            self.logger.error(f"Error removing lead paragraph: {str(e)}")
 
-                modifications["lead_paragraph"] = lead_removed
-            except Exception as e:
-                self.logger.error(f"Error removing lead paragraph: {str(e)}")
+        # 7. REPLACE TOOLBOX HEADERS
+        try:
+            toolbox_replaced = False
+
+            # Strategy 1: Use class-based selectors
+            toolbox_selectors = [
+                ".mqc-toolbox h3",
+                ".mqc-toolbox h4",
+                "#mqc_toolbox h3",
+                "#mqc_toolbox h4",
+                ".mqc_toolbox h3",
+                ".mqc_toolbox h4",
+            ]
 
-            # 7. REPLACE TOOLBOX HEADERS
-            try:
-                toolbox_replaced = False
-
-                # Strategy 1: Use class-based selectors
-                toolbox_selectors = [
-                    ".mqc-toolbox h3",
-                    ".mqc-toolbox h4",
-                    "#mqc_toolbox h3",
-                    "#mqc_toolbox h4",
-                    ".mqc_toolbox h3",
-                    ".mqc_toolbox h4",
-                ]
+            for selector in toolbox_selectors:
+                headers = soup.select(selector)
+                for header in headers:
+                    if "MultiQC" in header.get_text():
+                        header.string = header.get_text().replace(
+                            "MultiQC", "HyRISE"
+                        )
+                        toolbox_replaced = True
+                        self.logger.info(
+                            f"Replaced toolbox header with selector: {selector}"
+                        )
 
-                for selector in toolbox_selectors:
-                    headers = soup.select(selector)
-                    for header in headers:
-                        if "MultiQC" in header.get_text():
-                            header.string = header.get_text().replace(
-                                "MultiQC", "HyRISE"
-                            )
-                            toolbox_replaced = True
-                            self.logger.info(
-                                f"Replaced toolbox header with selector: {selector}"
-                            )
+            # Strategy 2: Find by content
+            if not toolbox_replaced:
+                for tag in soup.find_all(["h3", "h4"]):
+                    if (
+                        "toolbox" in tag.get_text().lower()
+                        and "MultiQC" in tag.get_text()
+                    ):
+                        tag.string = tag.get_text().replace("MultiQC", "HyRISE")
+                        toolbox_replaced = True
+                        self.logger.info(
+                            f"Replaced toolbox header by content match"
+                        )
 
-                # Strategy 2: Find by content
-                if not toolbox_replaced:
-                    for tag in soup.find_all(["h3", "h4"]):
-                        if (
-                            "toolbox" in tag.get_text().lower()
-                            and "MultiQC" in tag.get_text()
-                        ):
-                            tag.string = tag.get_text().replace("MultiQC", "HyRISE")
-                            toolbox_replaced = True
-                            self.logger.info(
-                                f"Replaced toolbox header by content match"
-                            )
+            modifications["toolbox"] = toolbox_replaced
+        except Exception as e:
+            self.logger.error(f"Error updating toolbox headers: {str(e)}")
 
-                modifications["toolbox"] = toolbox_replaced
-            except Exception as e:
-                self.logger.error(f"Error updating toolbox headers: {str(e)}")
+        # 8. UPDATE FOOTER
+        try:
+            footer_replaced = False
 
-            # 8. UPDATE FOOTER
-            try:
-                footer_replaced = False
+            # Strategy 1: Find by class
+            footer = soup.find(class_="footer")
+            if footer:
+                container = footer.find(class_="container-fluid") or footer
+                if container:
+                    # Preserve footer structure but replace content
+                    container.clear()
 
-                # Strategy 1: Find by class
-                footer = soup.find(class_="footer")
-                if footer:
-                    container = footer.find(class_="container-fluid") or footer
-                    if container:
-                        # Preserve footer structure but replace content
-                        container.clear()
+                    # Add our custom content with professional styling
+                    p1 = soup.new_tag("p")
+                    p1.string = f"Generated by HyRISE v{self.version} - HIV Resistance Interpretation & Scoring Engine"
+                    container.append(p1)
 
-                        # Add our custom content with professional styling
-                        p1 = soup.new_tag("p")
-                        p1.string = f"Generated by HyRISE v{self.version} - HIV Resistance Interpretation & Scoring Engine"
-                        container.append(p1)
+                    p2 = soup.new_tag("p")
+                    p2.string = "Developed by the National Microbiology Laboratory, Public Health Agency of Canada"
+                    container.append(p2)
 
-                        p2 = soup.new_tag("p")
-                        p2.string = "Developed by the National Microbiology Laboratory, Public Health Agency of Canada"
-                        container.append(p2)
+                    # Add attribution to MultiQC
+                    p3 = soup.new_tag("p", **{"class": "small text-muted"})
+                    p3.string = "Powered by MultiQC, a modular framework for bioinformatics reporting"
+                    container.append(p3)
 
-                        # Add attribution to MultiQC
-                        p3 = soup.new_tag("p", **{"class": "small text-muted"})
-                        p3.string = "Powered by MultiQC, a modular framework for bioinformatics reporting"
-                        container.append(p3)
+                    footer_replaced = True
+                    self.logger.info(
+                        "Replaced footer content with professional attribution"
+                    )
 
-                        footer_replaced = True
-                        self.logger.info(
-                            "Replaced footer content with professional attribution"
-                        )
+            # Strategy 2: Find by tag
+            if not footer_replaced:
+                footer = soup.find("footer")
+                if footer:
+                    footer.clear()
+
+                    div = soup.new_tag("div", **{"class": "container-fluid"})
 
-                # Strategy 2: Find by tag
-                if not footer_replaced:
-                    footer = soup.find("footer")
-                    if footer:
-                        footer.clear()
+                    p1 = soup.new_tag("p")
+                    p1.string = f"Generated by HyRISE v{self.version} - HIV Resistance Interpretation & Scoring Engine"
+                    div.append(p1)
 
+                    p2 = soup.new_tag("p")
+                    p2.string = "Developed by the National Microbiology Laboratory, Public Health Agency of Canada"
+                    div.append(p2)
+
+                    p3 = soup.new_tag("p", **{"class": "small text-muted"})
+                    p3.string = "Powered by MultiQC, a modular framework for bioinformatics reporting"
+                    div.append(p3)
+
+                    footer.append(div)
+                    footer_replaced = True
+                    self.logger.info("Replaced footer by tag")
+
+            # Strategy 3: Create footer if not found
+            if not footer_replaced:
+                body = soup.find("body")
+                if body:
+                    # Check if last child is already a footer
+                    last_child = list(body.children)[-1]
+                    if (
+                        last_child.name != "footer"
+                        and not last_child.get("class") == "footer"
+                    ):
+                        # Create new footer
+                        footer = soup.new_tag("footer", **{"class": "footer"})
                         div = soup.new_tag("div", **{"class": "container-fluid"})
 
                         p1 = soup.new_tag("p")
@@ -1453,415 +1558,356 @@ class HyRISEReportGenerator:
                         div.append(p3)
 
                         footer.append(div)
+                        body.append(footer)
                         footer_replaced = True
-                        self.logger.info("Replaced footer by tag")
-
-                # Strategy 3: Create footer if not found
-                if not footer_replaced:
-                    body = soup.find("body")
-                    if body:
-                        # Check if last child is already a footer
-                        last_child = list(body.children)[-1]
-                        if (
-                            last_child.name != "footer"
-                            and not last_child.get("class") == "footer"
-                        ):
-                            # Create new footer
-                            footer = soup.new_tag("footer", **{"class": "footer"})
-                            div = soup.new_tag("div", **{"class": "container-fluid"})
+                        self.logger.info("Created new footer")
+
+            modifications["footer"] = footer_replaced
+        except Exception as e:
+            self.logger.error(f"Error updating footer: {str(e)}")
+
+        # 9. UPDATE ABOUT SECTION WITH PROPER ATTRIBUTION
+        try:
+            about_replaced = False
+
+            # Strategy 1: Find by ID
+            about_section = soup.find(id="mqc_about")
+            if about_section:
+                about_section.clear()
+
+                # Add header
+                header = soup.new_tag("h4")
+                header.string = "About HyRISE"
+                about_section.append(header)
+
+                # Add content
+                p1 = soup.new_tag("p")
+                p1.string = f"This report was generated using HyRISE v{self.version} (HIV Resistance Interpretation & Scoring Engine)."
+                about_section.append(p1)
+
+                p2 = soup.new_tag("p")
+                p2.string = "HyRISE analyzes HIV drug resistance mutations and presents interactive visualizations with clinically oriented interpretation to support treatment planning."
+                about_section.append(p2)
+
+                # Add repository links
+                links_div = soup.new_tag("div", **{"class": "well well-sm"})
+                links_list = soup.new_tag("ul", **{"class": "list-unstyled"})
+
+                # GitHub link
+                li1 = soup.new_tag("li")
+                icon1 = soup.new_tag("i", **{"class": "fa fa-github"})
+                li1.append(icon1)
+                li1.append(" ")
+                a1 = soup.new_tag(
+                    "a", href="https://github.com/phac-nml/HyRISE", target="_blank"
+                )
+                a1.string = "GitHub Repository"
+                li1.append(a1)
+                links_list.append(li1)
+
+                # Add to section
+                links_div.append(links_list)
+                about_section.append(links_div)
+
+                # Attribution to MultiQC (important)
+                attribution = soup.new_tag("p", **{"class": "small text-muted"})
+                attribution.string = "HyRISE is built using the MultiQC framework (Ewels P, et al. MultiQC: Summarize analysis results for multiple tools and samples in a single report. Bioinformatics. 2016;32(19):3047-8)."
+                about_section.append(attribution)
+
+                about_replaced = True
+                self.logger.info("Updated About section with proper attribution")
+
+            # Strategy 2: Find by class or content
+            if not about_replaced:
+                # Look for any section containing "About MultiQC"
+                for section in soup.find_all("section"):
+                    header = section.find(["h3", "h4"])
+                    if header and "About MultiQC" in header.get_text():
+                        section.clear()
+
+                        h4 = soup.new_tag("h4")
+                        h4.string = "About HyRISE"
+                        section.append(h4)
 
-                            p1 = soup.new_tag("p")
-                            p1.string = f"Generated by HyRISE v{self.version} - HIV Resistance Interpretation & Scoring Engine"
-                            div.append(p1)
+                        p1 = soup.new_tag("p")
+                        p1.string = f"This report was generated using HyRISE v{self.version} (HIV Resistance Interpretation & Scoring Engine)."
+                        section.append(p1)
 
-                            p2 = soup.new_tag("p")
-                            p2.string = "Developed by the National Microbiology Laboratory, Public Health Agency of Canada"
-                            div.append(p2)
+                        p2 = soup.new_tag("p")
+                        p2.string = "HyRISE analyzes HIV drug resistance mutations and presents interactive visualizations with clinically oriented interpretation to support treatment planning."
+                        section.append(p2)
 
-                            p3 = soup.new_tag("p", **{"class": "small text-muted"})
-                            p3.string = "Powered by MultiQC, a modular framework for bioinformatics reporting"
-                            div.append(p3)
+                        # Attribution to MultiQC
+                        attribution = soup.new_tag(
+                            "p", **{"class": "small text-muted"}
+                        )
+                        attribution.string = "HyRISE is built using the MultiQC framework (Ewels P, et al. MultiQC: Summarize analysis results for multiple tools and samples in a single report. Bioinformatics. 2016;32(19):3047-8)."
+                        section.append(attribution)
 
-                            footer.append(div)
-                            body.append(footer)
-                            footer_replaced = True
-                            self.logger.info("Created new footer")
+                        about_replaced = True
+                        self.logger.info("Updated About section by content match")
+                        break
 
-                modifications["footer"] = footer_replaced
-            except Exception as e:
-                self.logger.error(f"Error updating footer: {str(e)}")
+            modifications["about_section"] = about_replaced
+        except Exception as e:
+            self.logger.error(f"Error updating About section: {str(e)}")
 
-            # 9. UPDATE ABOUT SECTION WITH PROPER ATTRIBUTION
-            try:
-                about_replaced = False
+        # 10. UPDATE WELCOME SECTION
+        try:
+            welcome_replaced = False
+
+            # Strategy 1: Find by ID or class
+            welcome_selectors = [
+                "#mqc_welcome",
+                ".mqc-welcome",
+                "section.welcome",
+                "div.welcome",
+            ]
 
-                # Strategy 1: Find by ID
-                about_section = soup.find(id="mqc_about")
-                if about_section:
-                    about_section.clear()
+            for selector in welcome_selectors:
+                welcome_elems = soup.select(selector)
+                for elem in welcome_elems:
+                    elem.clear()
 
-                    # Add header
-                    header = soup.new_tag("h4")
-                    header.string = "About HyRISE"
-                    about_section.append(header)
+                    title = soup.new_tag("h3")
+                    title.string = "HIV Resistance Analysis Report"
+                    elem.append(title)
 
-                    # Add content
                     p1 = soup.new_tag("p")
-                    p1.string = f"This report was generated using HyRISE v{self.version} (HIV Resistance Interpretation & Scoring Engine)."
-                    about_section.append(p1)
+                    p1.string = "This report summarizes HIV drug resistance mutations detected in your sample, with interactive visualizations and clinical context for interpretation."
+                    elem.append(p1)
 
                     p2 = soup.new_tag("p")
-                    p2.string = "HyRISE analyzes HIV drug resistance mutations and presents interactive visualizations with clinically oriented interpretation to support treatment planning."
-                    about_section.append(p2)
-
-                    # Add repository links
-                    links_div = soup.new_tag("div", **{"class": "well well-sm"})
-                    links_list = soup.new_tag("ul", **{"class": "list-unstyled"})
-
-                    # GitHub link
-                    li1 = soup.new_tag("li")
-                    icon1 = soup.new_tag("i", **{"class": "fa fa-github"})
-                    li1.append(icon1)
-                    li1.append(" ")
-                    a1 = soup.new_tag(
-                        "a", href="https://github.com/phac-nml/HyRISE", target="_blank"
+                    p2.string = "Navigate through the sections using the menu on the left. Key sections include drug resistance profiles, mutation analyses, and clinical implications."
+                    elem.append(p2)
+
+                    welcome_replaced = True
+                    self.logger.info(
+                        f"Updated welcome section with selector: {selector}"
                     )
-                    a1.string = "GitHub Repository"
-                    li1.append(a1)
-                    links_list.append(li1)
-
-                    # Add to section
-                    links_div.append(links_list)
-                    about_section.append(links_div)
-
-                    # Attribution to MultiQC (important)
-                    attribution = soup.new_tag("p", **{"class": "small text-muted"})
-                    attribution.string = "HyRISE is built using the MultiQC framework (Ewels P, et al. MultiQC: Summarize analysis results for multiple tools and samples in a single report. Bioinformatics. 2016;32(19):3047-8)."
-                    about_section.append(attribution)
-
-                    about_replaced = True
-                    self.logger.info("Updated About section with proper attribution")
-
-                # Strategy 2: Find by class or content
-                if not about_replaced:
-                    # Look for any section containing "About MultiQC"
-                    for section in soup.find_all("section"):
-                        header = section.find(["h3", "h4"])
-                        if header and "About MultiQC" in header.get_text():
-                            section.clear()
-
-                            h4 = soup.new_tag("h4")
-                            h4.string = "About HyRISE"
-                            section.append(h4)
-
-                            p1 = soup.new_tag("p")
-                            p1.string = f"This report was generated using HyRISE v{self.version} (HIV Resistance Interpretation & Scoring Engine)."
-                            section.append(p1)
-
-                            p2 = soup.new_tag("p")
-                            p2.string = "HyRISE analyzes HIV drug resistance mutations and presents interactive visualizations with clinically oriented interpretation to support treatment planning."
-                            section.append(p2)
-
-                            # Attribution to MultiQC
-                            attribution = soup.new_tag(
-                                "p", **{"class": "small text-muted"}
-                            )
-                            attribution.string = "HyRISE is built using the MultiQC framework (Ewels P, et al. MultiQC: Summarize analysis results for multiple tools and samples in a single report. Bioinformatics. 2016;32(19):3047-8)."
-                            section.append(attribution)
+                    break
+
+            # Strategy 2: Find introduction content
+            if not welcome_replaced:
+                intro_section = None
+                # Find first main content section
+                main_content = soup.find(id="mainContent") or soup.find(
+                    class_="mainpage"
+                )
 
-                            about_replaced = True
-                            self.logger.info("Updated About section by content match")
+                if main_content:
+                    # Look for a section with intro-like header
+                    for section in main_content.find_all("section"):
+                        header = section.find(["h1", "h2", "h3"])
+                        if header and any(
+                            word in header.get_text().lower()
+                            for word in ["welcome", "introduction", "about"]
+                        ):
+                            intro_section = section
                             break
 
-                modifications["about_section"] = about_replaced
-            except Exception as e:
-                self.logger.error(f"Error updating About section: {str(e)}")
-
-            # 10. UPDATE WELCOME SECTION
-            try:
-                welcome_replaced = False
-
-                # Strategy 1: Find by ID or class
-                welcome_selectors = [
-                    "#mqc_welcome",
-                    ".mqc-welcome",
-                    "section.welcome",
-                    "div.welcome",
-                ]
+                    # If no section found, use first section
+                    if not intro_section and main_content.find("section"):
+                        intro_section = main_content.find_all("section")[0]
 
-                for selector in welcome_selectors:
-                    welcome_elems = soup.select(selector)
-                    for elem in welcome_elems:
-                        elem.clear()
+                    if intro_section:
+                        intro_section.clear()
 
                         title = soup.new_tag("h3")
                         title.string = "HIV Resistance Analysis Report"
-                        elem.append(title)
+                        intro_section.append(title)
 
                         p1 = soup.new_tag("p")
                         p1.string = "This report summarizes HIV drug resistance mutations detected in your sample, with interactive visualizations and clinical context for interpretation."
-                        elem.append(p1)
+                        intro_section.append(p1)
 
                         p2 = soup.new_tag("p")
                         p2.string = "Navigate through the sections using the menu on the left. Key sections include drug resistance profiles, mutation analyses, and clinical implications."
-                        elem.append(p2)
+                        intro_section.append(p2)
 
                         welcome_replaced = True
                         self.logger.info(
-                            f"Updated welcome section with selector: {selector}"
+                            "Created new welcome section in main content"
                         )
-                        break
-
-                # Strategy 2: Find introduction content
-                if not welcome_replaced:
-                    intro_section = None
-                    # Find first main content section
-                    main_content = soup.find(id="mainContent") or soup.find(
-                        class_="mainpage"
-                    )
-
-                    if main_content:
-                        # Look for a section with intro-like header
-                        for section in main_content.find_all("section"):
-                            header = section.find(["h1", "h2", "h3"])
-                            if header and any(
-                                word in header.get_text().lower()
-                                for word in ["welcome", "introduction", "about"]
-                            ):
-                                intro_section = section
-                                break
-
-                        # If no section found, use first section
-                        if not intro_section and main_content.find("section"):
-                            intro_section = main_content.find_all("section")[0]
-
-                        if intro_section:
-                            intro_section.clear()
-
-                            title = soup.new_tag("h3")
-                            title.string = "HIV Resistance Analysis Report"
-                            intro_section.append(title)
-
-                            p1 = soup.new_tag("p")
-                            p1.string = "This report summarizes HIV drug resistance mutations detected in your sample, with interactive visualizations and clinical context for interpretation."
-                            intro_section.append(p1)
-
-                            p2 = soup.new_tag("p")
-                            p2.string = "Navigate through the sections using the menu on the left. Key sections include drug resistance profiles, mutation analyses, and clinical implications."
-                            intro_section.append(p2)
-
-                            welcome_replaced = True
-                            self.logger.info(
-                                "Created new welcome section in main content"
-                            )
-
-                modifications["welcome"] = welcome_replaced
-            except Exception as e:
-                self.logger.error(f"Error updating welcome section: {str(e)}")
 
-            # 11. UPDATE CITATIONS SECTION
-            try:
-                citations_updated = False
-
-                # Strategy 1: Find by ID
-                citations = soup.find(id="mqc_citing")
-                if citations:
-                    # Replace with HyRISE citation
-                    citations.clear()
+            modifications["welcome"] = welcome_replaced
+        except Exception as e:
+            self.logger.error(f"Error updating welcome section: {str(e)}")
 
-                    title = soup.new_tag("h4")
-                    title.string = "Citing HyRISE"
-                    citations.append(title)
+        # 11. UPDATE CITATIONS SECTION
+        try:
+            citations_updated = False
 
-                    intro = soup.new_tag("p")
-                    intro.string = "If you use HyRISE in your research, please cite:"
-                    citations.append(intro)
+            # Strategy 1: Find by ID
+            citations = soup.find(id="mqc_citing")
+            if citations:
+                # Replace with HyRISE citation
+                citations.clear()
 
-                    citation_box = soup.new_tag("div", **{"class": "well"})
+                title = soup.new_tag("h4")
+                title.string = "Citing HyRISE"
+                citations.append(title)
 
-                    # HyRISE citation
-                    p1 = soup.new_tag("p")
-                    strong = soup.new_tag("strong")
-                    strong.string = (
-                        "HyRISE: HIV Resistance Interpretation & Scoring Engine"
-                    )
-                    p1.append(strong)
-                    citation_box.append(p1)
-
-                    p2 = soup.new_tag("p")
-                    p2.string = "Osahan G, et al. National Microbiology Laboratory, Public Health Agency of Canada (2025)"
-                    citation_box.append(p2)
-
-                    p3 = soup.new_tag("p")
-                    p3.string = "Available at: "
-                    link = soup.new_tag("a", href="https://github.com/phac-nml/HyRISE")
-                    link.string = "https://github.com/phac-nml/HyRISE"
-                    p3.append(link)
-                    citation_box.append(p3)
-
-                    # MultiQC citation (important for attribution)
-                    p4 = soup.new_tag("p", **{"class": "small text-muted"})
-                    p4.string = "HyRISE is built using the MultiQC framework:"
-                    citation_box.append(p4)
-
-                    p5 = soup.new_tag("p", **{"class": "small text-muted"})
-                    em = soup.new_tag("em")
-                    em.string = "Ewels P, Magnusson M, Lundin S, Käller M. MultiQC: Summarize analysis results for multiple tools and samples in a single report. Bioinformatics. 2016;32(19):3047-8."
-                    p5.append(em)
-                    citation_box.append(p5)
-
-                    citations.append(citation_box)
-                    citations_updated = True
-                    self.logger.info(
-                        "Updated citations section with HyRISE and MultiQC citations"
-                    )
+                intro = soup.new_tag("p")
+                intro.string = "If you use HyRISE in your research, please cite:"
+                citations.append(intro)
 
-                # Strategy 2: Find by content
-                if not citations_updated:
-                    # Look for any section containing "Citing MultiQC"
-                    for section in soup.find_all("section"):
-                        header = section.find(["h3", "h4"])
-                        if (
-                            header
-                            and "Citing" in header.get_text()
-                            and "MultiQC" in header.get_text()
-                        ):
-                            section.clear()
+                citation_box = soup.new_tag("div", **{"class": "well"})
 
-                            h4 = soup.new_tag("h4")
-                            h4.string = "Citing HyRISE"
-                            section.append(h4)
+                # HyRISE citation
+                p1 = soup.new_tag("p")
+                strong = soup.new_tag("strong")
+                strong.string = (
+                    "HyRISE: HIV Resistance Interpretation & Scoring Engine"
+                )
+                p1.append(strong)
+                citation_box.append(p1)
+
+                p2 = soup.new_tag("p")
+                p2.string = "Osahan G, et al. National Microbiology Laboratory, Public Health Agency of Canada (2025)"
+                citation_box.append(p2)
+
+                p3 = soup.new_tag("p")
+                p3.string = "Available at: "
+                link = soup.new_tag("a", href="https://github.com/phac-nml/HyRISE")
+                link.string = "https://github.com/phac-nml/HyRISE"
+                p3.append(link)
+                citation_box.append(p3)
+
+                # MultiQC citation (important for attribution)
+                p4 = soup.new_tag("p", **{"class": "small text-muted"})
+                p4.string = "HyRISE is built using the MultiQC framework:"
+                citation_box.append(p4)
+
+                p5 = soup.new_tag("p", **{"class": "small text-muted"})
+                em = soup.new_tag("em")
+                em.string = "Ewels P, Magnusson M, Lundin S, Käller M. MultiQC: Summarize analysis results for multiple tools and samples in a single report. Bioinformatics. 2016;32(19):3047-8."
+                p5.append(em)
+                citation_box.append(p5)
+
+                citations.append(citation_box)
+                citations_updated = True
+                self.logger.info(
+                    "Updated citations section with HyRISE and MultiQC citations"
+                )
 
-                            intro = soup.new_tag("p")
-                            intro.string = (
-                                "If you use HyRISE in your research, please cite:"
-                            )
-                            section.append(intro)
+            # Strategy 2: Find by content
+            if not citations_updated:
+                # Look for any section containing "Citing MultiQC"
+                for section in soup.find_all("section"):
+                    header = section.find(["h3", "h4"])
+                    if (
+                        header
+                        and "Citing" in header.get_text()
+                        and "MultiQC" in header.get_text()
+                    ):
+                        section.clear()
 
-                            citation_box = soup.new_tag("div", **{"class": "well"})
+                        h4 = soup.new_tag("h4")
+                        h4.string = "Citing HyRISE"
+                        section.append(h4)
 
-                            # HyRISE citation
-                            p1 = soup.new_tag("p")
-                            strong = soup.new_tag("strong")
-                            strong.string = (
-                                "HyRISE: HIV Resistance Interpretation & Scoring Engine"
-                            )
-                            p1.append(strong)
-                            citation_box.append(p1)
-
-                            p2 = soup.new_tag("p")
-                            p2.string = "Osahan G, et al. National Microbiology Laboratory, Public Health Agency of Canada (2025)"
-                            citation_box.append(p2)
-
-                            # MultiQC citation (important for attribution)
-                            p4 = soup.new_tag("p", **{"class": "small text-muted"})
-                            p4.string = "HyRISE is built using the MultiQC framework:"
-                            citation_box.append(p4)
-
-                            p5 = soup.new_tag("p", **{"class": "small text-muted"})
-                            em = soup.new_tag("em")
-                            em.string = "Ewels P, Magnusson M, Lundin S, Käller M. MultiQC: Summarize analysis results for multiple tools and samples in a single report. Bioinformatics. 2016;32(19):3047-8."
-                            p5.append(em)
-                            citation_box.append(p5)
-
-                            section.append(citation_box)
-                            citations_updated = True
-                            self.logger.info(
-                                "Updated citations section by content match"
-                            )
-                            break
+                        intro = soup.new_tag("p")
+                        intro.string = (
+                            "If you use HyRISE in your research, please cite:"
+                        )
+                        section.append(intro)
 
-                modifications["citations"] = citations_updated
-            except Exception as e:
-                self.logger.error(f"Error updating citations section: {str(e)}")
+                        citation_box = soup.new_tag("div", **{"class": "well"})
 
-            # 12. UPDATE LINKS
-            try:
-                links_updated = False
-
-                # Define link replacements
-                link_replacements = {
-                    "http://multiqc.info": "https://github.com/phac-nml/HyRISE",
-                    "https://multiqc.info": "https://github.com/phac-nml/HyRISE",
-                    "https://github.com/MultiQC/MultiQC": "https://github.com/phac-nml/HyRISE",
-                    "https://github.com/ewels/MultiQC": "https://github.com/phac-nml/HyRISE",
-                    "https://seqera.io": "https://www.canada.ca/en/public-health.html",
-                }
+                        # HyRISE citation
+                        p1 = soup.new_tag("p")
+                        strong = soup.new_tag("strong")
+                        strong.string = (
+                            "HyRISE: HIV Resistance Interpretation & Scoring Engine"
+                        )
+                        p1.append(strong)
+                        citation_box.append(p1)
 
-                # Update all matching links
-                for a_tag in soup.find_all("a", href=True):
-                    original_href = a_tag["href"]
+                        p2 = soup.new_tag("p")
+                        p2.string = "Osahan G, et al. National Microbiology Laboratory, Public Health Agency of Canada (2025)"
+                        citation_box.append(p2)
+
+                        # MultiQC citation (important for attribution)
+                        p4 = soup.new_tag("p", **{"class": "small text-muted"})
+                        p4.string = "HyRISE is built using the MultiQC framework:"
+                        citation_box.append(p4)
+
+                        p5 = soup.new_tag("p", **{"class": "small text-muted"})
+                        em = soup.new_tag("em")
+                        em.string = "Ewels P, Magnusson M, Lundin S, Käller M. MultiQC: Summarize analysis results for multiple tools and samples in a single report. Bioinformatics. 2016;32(19):3047-8."
+                        p5.append(em)
+                        citation_box.append(p5)
+
+                        section.append(citation_box)
+                        citations_updated = True
+                        self.logger.info(
+                            "Updated citations section by content match"
+                        )
+                        break
 
-                    for old_url, new_url in link_replacements.items():
-                        if old_url in original_href:
-                            a_tag["href"] = original_href.replace(old_url, new_url)
-                            links_updated = True
+            modifications["citations"] = citations_updated
+        except Exception as e:
+            self.logger.error(f"Error updating citations section: {str(e)}")
 
-                            # Update link text if it contains MultiQC
-                            if a_tag.string and "MultiQC" in a_tag.string:
-                                a_tag.string = a_tag.string.replace("MultiQC", "HyRISE")
+        # 12. UPDATE LINKS
+        try:
+            links_updated = False
+
+            # Define link replacements
+            link_replacements = {
+                "http://multiqc.info": "https://github.com/phac-nml/HyRISE",
+                "https://multiqc.info": "https://github.com/phac-nml/HyRISE",
+                "https://github.com/MultiQC/MultiQC": "https://github.com/phac-nml/HyRISE",
+                "https://github.com/ewels/MultiQC": "https://github.com/phac-nml/HyRISE",
+                "https://seqera.io": "https://www.canada.ca/en/public-health.html",
+            }
 
-                if links_updated:
-                    self.logger.info("Updated links to point to HyRISE resources")
+            # Update all matching links
+            for a_tag in soup.find_all("a", href=True):
+                original_href = a_tag["href"]
 
-                modifications["links"] = links_updated
-            except Exception as e:
-                self.logger.error(f"Error updating links: {str(e)}")
+                for old_url, new_url in link_replacements.items():
+                    if old_url in original_href:
+                        a_tag["href"] = original_href.replace(old_url, new_url)
+                        links_updated = True
 
-            # 13. MAKE ONLY LOGO CLICKABLE (NOT ENTIRE TITLE BAR)
-            try:
-                for logo_wrapper in soup.select(".multiqc-logo-wrapper"):
-                    href = "https://github.com/phac-nml/HyRISE"
-                    parent_anchor = logo_wrapper.parent
-                    if (
-                        parent_anchor
-                        and parent_anchor.name == "a"
-                        and parent_anchor.get("href") == href
-                    ):
-                        # Unwrap anchor so container itself is no longer fully clickable.
-                        parent_anchor.unwrap()
+                        # Update link text if it contains MultiQC
+                        if a_tag.string and "MultiQC" in a_tag.string:
+                            a_tag.string = a_tag.string.replace("MultiQC", "HyRISE")
 
-                    # Wrap only the logo element.
-                    logo_elem = logo_wrapper.select_one(
-                        "img.custom_logo, img, svg.multiqc-logo, svg"
-                    )
-                    if logo_elem and logo_elem.parent.name != "a":
-                        logo_link = soup.new_tag("a", href=href, target="_blank")
-                        logo_link["rel"] = "noopener noreferrer"
-                        logo_elem.wrap(logo_link)
-            except Exception as e:
-                self.logger.error(f"Error scoping logo click target: {str(e)}")
+            if links_updated:
+                self.logger.info("Updated links to point to HyRISE resources")
 
-            # Write the updated HTML back to the file
-            try:
-                with open(html_path, "w", encoding="utf-8") as file:
-                    file.write(str(soup))
+            modifications["links"] = links_updated
+        except Exception as e:
+            self.logger.error(f"Error updating links: {str(e)}")
 
-                # Log successful modifications
-                modified_items = [k for k, v in modifications.items() if v]
-                self.logger.info(
-                    f"HTML modifications completed successfully. Modified: {', '.join(modified_items)}"
+        # 13. MAKE ONLY LOGO CLICKABLE (NOT ENTIRE TITLE BAR)
+        try:
+            for logo_wrapper in soup.select(".multiqc-logo-wrapper"):
+                href = "https://github.com/phac-nml/HyRISE"
+                parent_anchor = logo_wrapper.parent
+                if (
+                    parent_anchor
+                    and parent_anchor.name == "a"
+                    and parent_anchor.get("href") == href
+                ):
+                    # Unwrap anchor so container itself is no longer fully clickable.
+                    parent_anchor.unwrap()
+
+                # Wrap only the logo element.
+                logo_elem = logo_wrapper.select_one(
+                    "img.custom_logo, img, svg.multiqc-logo, svg"
                 )
-
-                return True, modifications
-            except Exception as e:
-                self.logger.error(f"Error writing modified HTML: {str(e)}")
-                # Try to restore from backup
-                try:
-                    if os.path.exists(f"{html_path}.backup"):
-                        shutil.copy2(f"{html_path}.backup", html_path)
-                        self.logger.info("Restored HTML from backup after write error")
-                except Exception:
-                    self.logger.error("Failed to restore from backup")
-
-                return False, {}
-
+                if logo_elem and logo_elem.parent.name != "a":
+                    logo_link = soup.new_tag("a", href=href, target="_blank")
+                    logo_link["rel"] = "noopener noreferrer"
+                    logo_elem.wrap(logo_link)
         except Exception as e:
-            self.logger.error(f"Unexpected error in HTML modification: {str(e)}")
-            import traceback
+            self.logger.error(f"Error scoping logo click target: {str(e)}")
 
-            self.logger.error(traceback.format_exc())
-            return False, {}
+        return str(soup), modifications
 
     def post_process_report(
         self, logo_path: Optional[str] = None
@@ -12,6 +12,7 @@ import argparse
 import requests
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from hyrise.config import load_config, resolve_resource_dir
@@ -38,14 +39,15 @@ def _safe_filename(filename: str) -> str:
 def _safe_resource_path(resource_dir: Path, filename: str) -> Path:
     """
     Build a normalized path under ``resource_dir`` and ensure it cannot escape.
+
+    The target is resolved before the containment check, so an existing
+    symlink that points outside the directory is rejected as well.
     """
     safe_name = _safe_filename(filename)
     root = resource_dir.resolve()
     target = (root / safe_name).resolve()
-    try:
-        target.relative_to(root)
-    except ValueError as exc:
-        raise ValueError(f"Unsafe resource path for filename: {filename}") from exc
+    if not target.is_relative_to(root):
+        raise ValueError(f"Unsafe resource path for filename: {filename}")
     return target
 
 
@@ -67,19 +69,30 @@ def select_latest_hivdb_xml(xml_paths):
 
     Version ordering is numeric (`10.1` > `9.9`), not lexical.
     """
-    candidates = []
-    for path in xml_paths:
-        version = _hivdb_version_tuple(Path(path))
+    best_key = None
+    best_path = None
+    for path in map(Path, xml_paths):
+        version = _hivdb_version_tuple(path)
         if version is None:
             continue
-        candidates.append((version, Path(path)))
+        # Tie-break on filename for deterministic behavior if versions are equal.
+        key = (version, path.name)
+        if best_key is None or key > best_key:
+            best_key, best_path = key, path
+
+    return best_path
 
-    if not candidates:
-        return None
 
-    # Tie-break on filename for deterministic behavior if versions are equal.
-    candidates.sort(key=lambda item: (item[0], item[1].name))
-    return candidates[-1][1]
+@lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    """
+    Return the HTTP session shared by all resource downloads.
+
+    Every resource lives on the same host, so reusing one session keeps the
+    connection alive between files instead of repeating the TCP and TLS
+    handshake for each download.
+    """
+    return requests.Session()
 
 
 # Define resource directory
@@ -120,7 +133,7 @@ def download_file(url, filename, resource_dir=None, config=None):
 
     try:
         logger.info(f"Downloading {filename} from {url}")
-        response = requests.get(url, allow_redirects=True, timeout=60)
+        response = _http_session().get(url, allow_redirects=True, timeout=60)
         response.raise_for_status()  # Raise exception for 4XX/5XX responses
 
         with open(filepath, "wb") as file:
@@ -147,10 +160,11 @@ def update_hivdb_xml(resource_dir=None, config=None):
     try:
         # First query for the latest filename
         url = "https://raw.githubusercontent.com/hivdb/hivfacts/main/data/algorithms/HIVDB_latest.xml"
-        response = requests.get(url)
+        response = _http_session().get(url, timeout=60)
         response.raise_for_status()
-        latest_filename = _safe_filename(response.text.strip())
-        if not _HIVDB_XML_RE.match(latest_filename):
+        # The pattern only admits a bare HIVDB_<version>.xml leaf name
+        latest_filename = response.text.strip()
+        if not _HIVDB_XML_RE.fullmatch(latest_filename):
             raise ValueError(
                 f"Unexpected HIVDB latest filename format: {latest_filename}"
             )
@@ -279,7 +293,17 @@ def get_latest_resource_path(resource_type, resource_dir=None, config=None):
     resource_dir = get_resource_dir(resource_dir=resource_dir, config=config)
 
     if resource_type == "hivdb_xml":
-        latest_xml = select_latest_hivdb_xml(resource_dir.glob("HIVDB_*.xml"))
+        # scandir's cached entry type avoids a stat() and a Path per entry;
+        # symlinks are skipped so a link cannot point the lookup outside
+        with os.scandir(resource_dir) as entries:
+            xml_paths = [
+                entry.path
+                for entry in entries
+                if entry.name.startswith("HIVDB_")
+                and entry.name.endswith(".xml")
+                and entry.is_file(follow_symlinks=False)
+            ]
+        latest_xml = select_latest_hivdb_xml(xml_paths)
         return str(latest_xml) if latest_xml else None
 
     elif resource_type == "apobec_drms":
@@ -11,10 +11,10 @@ resistance data, organized into logical categories:
 The module supports multiple HIV genes including PR, RT, IN, and CA (Capsid).
 """
 import os
-import json
 import logging
 from collections import defaultdict
 
+from hyrise.core.file_utils import write_html_file, write_json_file
 from hyrise.utils.html_utils import create_html_header, create_html_footer
 
 # Set up logging
@@ -76,6 +76,29 @@ MUTATION_TYPE_COLORS = {
     "Other": "#f8f9fa",  # Light gray for other mutations
 }
 
+# Rows of the mutation distribution summary in the position map: the
+# position list to count, the row label, and whether the row is only shown
+# when at least one such mutation is present (special categories)
+POSITION_SUMMARY_ROWS = (
+    ("major_positions", "Major Mutations", False),
+    ("accessory_positions", "Accessory Mutations", False),
+    ("other_positions", "Other Mutations", False),
+    ("sdrm_positions", "SDRM Mutations", True),
+    ("apobec_positions", "APOBEC-Mediated Mutations", True),
+)
+
+# CSS classes for mutated cells in the position map. A position gets the
+# first matching type class; the marker classes are added independently.
+POSITION_TYPE_CLASSES = (
+    ("major_positions", "position-major"),
+    ("accessory_positions", "position-accessory"),
+    ("other_positions", "position-other"),
+)
+POSITION_MARKER_CLASSES = (
+    ("sdrm_positions", "position-sdrm"),
+    ("apobec_positions", "position-apobec"),
+)
+
 # ===== MUTATION-BASED VISUALIZATIONS =====
 
 
@@ -250,8 +273,7 @@ def create_mutation_details_table(data, sample_id, output_dir):
             output_dir, f"mutation_details_{gene_name.lower()}_mqc.json"
         )
         try:
-            with open(output_file, "w") as f:
-                json.dump(table_output, f, indent=2)
+            write_json_file(output_file, table_output)
             created_files[gene_name] = output_file
             logger.info(
                 f"Created mutation details table for {gene_name} gene: {output_file}"
@@ -363,6 +385,9 @@ def create_mutation_position_visualization(data, sample_id, output_dir):
                     }
                 )
 
+    # The footer is the same for every gene, so build it once
+    html_footer = create_html_footer()
+
     # Create visualization for each gene
     for gene_name, mutation_data in gene_mutations.items():
         if not mutation_data["positions"]:
@@ -438,6 +463,7 @@ def create_mutation_position_visualization(data, sample_id, output_dir):
 
         first_pos = mutation_data["first_aa"]
         last_pos = mutation_data["last_aa"]
+        cell_classes = _position_cell_classes(mutation_data)
 
         if use_divisions:
             # Create rows of positions for better visualization of long genes
@@ -449,10 +475,10 @@ def create_mutation_position_visualization(data, sample_id, output_dir):
                     f"<div class='position-label'>{start_pos}-{end_pos}</div>\n"
                 )
                 html_content += "<div class='position-cells'>\n"
-
-                for pos in range(start_pos, end_pos + 1):
-                    # FIX: Capture the returned HTML content
-                    html_content = _add_position_cell(html_content, pos, mutation_data)
+                html_content += "".join(
+                    _position_cell_html(pos, mutation_data, cell_classes)
+                    for pos in range(start_pos, end_pos + 1)
+                )
 
                 html_content += "</div>\n"  # End position-cells
                 html_content += "</div>\n"  # End position-row
@@ -463,10 +489,10 @@ def create_mutation_position_visualization(data, sample_id, output_dir):
                 f"<div class='position-label'>{first_pos}-{last_pos}</div>\n"
             )
             html_content += "<div class='position-cells'>\n"
-
-            for pos in range(first_pos, last_pos + 1):
-                # FIX: Capture the returned HTML content
-                html_content = _add_position_cell(html_content, pos, mutation_data)
+            html_content += "".join(
+                _position_cell_html(pos, mutation_data, cell_classes)
+                for pos in range(first_pos, last_pos + 1)
+            )
 
             html_content += "</div>\n"  # End position-cells
             html_content += "</div>\n"  # End position-row
@@ -493,41 +519,12 @@ def create_mutation_position_visualization(data, sample_id, output_dir):
 
             total_mutations = len(set(mutation_data["positions"]))
 
-            # Major mutations
-            major_count = len(set(mutation_data["major_positions"]))
-            major_pct = (
-                (major_count / total_mutations * 100) if total_mutations > 0 else 0
-            )
-            html_content += f"<tr style='border-bottom: 1px solid #ddd;'><td style='padding: 8px;'>Major Mutations</td><td style='text-align: right; padding: 8px;'>{major_count}</td><td style='text-align: right; padding: 8px;'>{major_pct:.1f}%</td></tr>\n"
-
-            # Accessory mutations
-            accessory_count = len(set(mutation_data["accessory_positions"]))
-            accessory_pct = (
-                (accessory_count / total_mutations * 100) if total_mutations > 0 else 0
-            )
-            html_content += f"<tr style='border-bottom: 1px solid #ddd;'><td style='padding: 8px;'>Accessory Mutations</td><td style='text-align: right; padding: 8px;'>{accessory_count}</td><td style='text-align: right; padding: 8px;'>{accessory_pct:.1f}%</td></tr>\n"
-
-            # Other mutations
-            other_count = len(set(mutation_data["other_positions"]))
-            other_pct = (
-                (other_count / total_mutations * 100) if total_mutations > 0 else 0
-            )
-            html_content += f"<tr style='border-bottom: 1px solid #ddd;'><td style='padding: 8px;'>Other Mutations</td><td style='text-align: right; padding: 8px;'>{other_count}</td><td style='text-align: right; padding: 8px;'>{other_pct:.1f}%</td></tr>\n"
-
-            # Special categories
-            sdrm_count = len(set(mutation_data["sdrm_positions"]))
-            if sdrm_count > 0:
-                sdrm_pct = (
-                    (sdrm_count / total_mutations * 100) if total_mutations > 0 else 0
-                )
-                html_content += f"<tr style='border-bottom: 1px solid #ddd;'><td style='padding: 8px;'>SDRM Mutations</td><td style='text-align: right; padding: 8px;'>{sdrm_count}</td><td style='text-align: right; padding: 8px;'>{sdrm_pct:.1f}%</td></tr>\n"
-
-            apobec_count = len(set(mutation_data["apobec_positions"]))
-            if apobec_count > 0:
-                apobec_pct = (
-                    (apobec_count / total_mutations * 100) if total_mutations > 0 else 0
-                )
-                html_content += f"<tr style='border-bottom: 1px solid #ddd;'><td style='padding: 8px;'>APOBEC-Mediated Mutations</td><td style='text-align: right; padding: 8px;'>{apobec_count}</td><td style='text-align: right; padding: 8px;'>{apobec_pct:.1f}%</td></tr>\n"
+            for key, label, only_if_present in POSITION_SUMMARY_ROWS:
+                count = len(set(mutation_data[key]))
+                if only_if_present and count == 0:
+                    continue
+                pct = (count / total_mutations * 100) if total_mutations > 0 else 0
+                html_content += f"<tr style='border-bottom: 1px solid #ddd;'><td style='padding: 8px;'>{label}</td><td style='text-align: right; padding: 8px;'>{count}</td><td style='text-align: right; padding: 8px;'>{pct:.1f}%</td></tr>\n"
 
             # Total row
             html_content += f"<tr style='font-weight: bold;'><td style='padding: 8px;'>Total Mutations</td><td style='text-align: right; padding: 8px;'>{total_mutations}</td><td style='text-align: right; padding: 8px;'>100.0%</td></tr>\n"
@@ -535,15 +532,14 @@ def create_mutation_position_visualization(data, sample_id, output_dir):
             html_content += "</table>\n"
             html_content += "</div>\n"
 
-        html_content += create_html_footer()
+        html_content += html_footer
 
         # Write the HTML position map to file
         output_file = os.path.join(
             output_dir, f"mutation_position_map_{gene_name.lower()}_mqc.html"
         )
         try:
-            with open(output_file, "w") as f:
-                f.write(html_content)
+            write_html_file(output_file, html_content)
             created_files[gene_name] = output_file
             logger.info(
                 f"Created mutation position map for {gene_name} gene: {output_file}"
@@ -556,42 +552,64 @@ def create_mutation_position_visualization(data, sample_id, output_dir):
     return created_files
 
 
-def _add_position_cell(html_content, pos, mutation_data):
+def _position_cell_classes(mutation_data):
     """
-    Helper function to add a position cell to the HTML content.
+    Helper function to resolve the CSS classes of every mutated position.
+
+    The position lists are scanned once per gene instead of testing list
+    membership for every cell in the map.
+
+    Args:
+        mutation_data (dict): Mutation data for the current gene
+
+    Returns:
+        dict: Mapping of mutated position to its cell class string
+    """
+    type_classes = {}
+    # Apply lowest priority first so the first matching type class wins
+    for key, css_class in reversed(POSITION_TYPE_CLASSES):
+        for pos in mutation_data[key]:
+            type_classes[pos] = css_class
+
+    marker_positions = [
+        (set(mutation_data[key]), css_class)
+        for key, css_class in POSITION_MARKER_CLASSES
+    ]
+
+    cell_classes = {}
+    for pos in mutation_data["positions"]:
+        classes = ["position-cell"]
+        if pos in type_classes:
+            classes.append(type_classes[pos])
+        for positions, css_class in marker_positions:
+            if pos in positions:
+                classes.append(css_class)
+        cell_classes[pos] = " ".join(classes)
+
+    return cell_classes
+
+
+def _position_cell_html(pos, mutation_data, cell_classes):
+    """
+    Helper function to build the HTML for a single position cell.
+
+    Cells are joined by the caller in one pass rather than appended to the
+    growing page one at a time, which would copy the whole page per position.
 
     Args:
-        html_content (str): The HTML content string to append to
         pos (int): Position number
         mutation_data (dict): Mutation data for the current gene
+        cell_classes (dict): Cell classes of mutated positions, as returned
+            by _position_cell_classes
 
     Returns:
-        str: The updated HTML content string
+        str: HTML for the position cell
     """
-    cell_class = "position-cell"
-
-    # Determine cell class based on mutation type
-    if pos in mutation_data["major_positions"]:
-        cell_class += " position-major"
-    elif pos in mutation_data["accessory_positions"]:
-        cell_class += " position-accessory"
-    elif pos in mutation_data["other_positions"]:
-        cell_class += " position-other"
-    else:
-        # No mutation at this position, just the base cell style
-        pass
-
-    # Add SDRM and APOBEC indicators if this position has those special types
-    if pos in mutation_data["sdrm_positions"]:
-        cell_class += " position-sdrm"
-
-    if pos in mutation_data["apobec_positions"]:
-        cell_class += " position-apobec"
+    # Positions without a mutation just get the base cell style
+    cell_class = cell_classes.get(pos, "position-cell")
 
     # Only show position number for positions divisible by 10 or positions with mutations
-    display_pos = (
-        str(pos) if pos % 10 == 0 or pos in mutation_data["positions"] else "&nbsp;"
-    )
+    display_pos = str(pos) if pos % 10 == 0 or pos in cell_classes else "&nbsp;"
 
     # Create tooltip content with detailed mutation information if applicable
     tooltip_html = ""
@@ -622,10 +640,8 @@ def _add_position_cell(html_content, pos, mutation_data):
 
         tooltip_html += "</ul></span>"
 
-    # Construct the full cell HTML and append it to the existing content
-    cell_html = f"<div class='{cell_class}' title='Position {pos}'>{display_pos}{tooltip_html}</div>\n"
-
-    return html_content + cell_html
+    # Construct the full cell HTML
+    return f"<div class='{cell_class}' title='Position {pos}'>{display_pos}{tooltip_html}</div>\n"
 
 
 def create_mutation_type_summary(data, sample_id, output_dir):
@@ -857,8 +873,7 @@ def create_mutation_type_summary(data, sample_id, output_dir):
             output_dir, f"mutation_summary_{gene_name.lower()}_mqc.json"
         )
         try:
-            with open(output_file, "w") as f:
-                json.dump(mutation_summary_table, f, indent=2)
+            write_json_file(output_file, mutation_summary_table)
             created_files[gene_name] = output_file
             logger.info(
                 f"Created mutation type summary for {gene_name} gene: {output_file}"
@@ -1079,8 +1094,7 @@ def create_drug_resistance_profile(data, sample_id, output_dir):
             output_dir, f"drug_resistance_{gene_name.lower()}_table_mqc.json"
         )
         try:
-            with open(output_file, "w") as f:
-                json.dump(table_data, f, indent=2)
+            write_json_file(output_file, table_data)
             created_files[gene_name] = output_file
             logger.info(
                 f"Created drug resistance profile for {gene_name} gene: {output_file}"
@@ -1206,32 +1220,29 @@ def create_drug_class_resistance_summary(data, sample_id, output_dir):
         table_data = {}
 
         # Calculate total drugs and resistant percentage across all classes
-        total_drugs = sum(cls["total_drugs"] for cls in class_overview.values())
-        total_resistant = sum(cls["resistant_drugs"] for cls in class_overview.values())
-        total_priority_affected = sum(
-            cls["priority_drugs_affected"] for cls in class_overview.values()
-        )
+        total_drugs = 0
+        total_resistant = 0
+        total_priority_affected = 0
+        for cls in class_overview.values():
+            total_drugs += cls["total_drugs"]
+            total_resistant += cls["resistant_drugs"]
+            total_priority_affected += cls["priority_drugs_affected"]
         overall_resistant_percent = (
             (total_resistant / total_drugs * 100) if total_drugs > 0 else 0
         )
 
         # Add a row for each drug class
-        for drug_class, overview in sorted(class_overview.items()):
-            if overview["total_drugs"] == 0:
+        for drug_class in sorted(class_overview):
+            overview = class_overview[drug_class]
+            class_total = overview["total_drugs"]
+            # Empty classes produce no row; everything below may divide by the total
+            if class_total == 0:
                 continue
 
-            resistant_percent = (
-                (overview["resistant_drugs"] / overview["total_drugs"] * 100)
-                if overview["total_drugs"] > 0
-                else 0
-            )
+            resistant_percent = overview["resistant_drugs"] / class_total * 100
 
             # Calculate average weighted score
-            avg_weighted_score = (
-                overview["weighted_score_sum"] / overview["total_drugs"]
-                if overview["total_drugs"] > 0
-                else 0
-            )
+            avg_weighted_score = overview["weighted_score_sum"] / class_total
 
             # Create a row ID for the drug class
             row_id = f"{gene_name}_{drug_class.replace(' ', '_')}"
@@ -1413,8 +1424,7 @@ def create_drug_class_resistance_summary(data, sample_id, output_dir):
             output_dir, f"drug_class_overview_{gene_name.lower()}_table_mqc.json"
         )
         try:
-            with open(output_file, "w") as f:
-                json.dump(summary_table, f, indent=2)
+            write_json_file(output_file, summary_table)
             created_files[gene_name] = output_file
             logger.info(
                 f"Created drug class overview for {gene_name} gene: {output_file}"
@@ -1724,8 +1734,7 @@ def create_mutation_resistance_contribution(data, sample_id, output_dir):
             output_dir, f"mutation_contribution_{gene_name.lower()}_mqc.json"
         )
         try:
-            with open(output_file, "w") as f:
-                json.dump(table_data, f, indent=2)
+            write_json_file(output_file, table_data)
             created_files[gene_name] = output_file
             logger.info(
                 f"Created mutation resistance contribution for {gene_name} gene: {output_file}"
@@ -2008,8 +2017,7 @@ def create_mutation_clinical_commentary(data, sample_id, output_dir):
             output_dir, f"mutation_clinical_{gene_name.lower()}_table_mqc.json"
         )
         try:
-            with open(output_file, "w") as f:
-                json.dump(clinical_table, f, indent=2)
+            write_json_file(output_file, clinical_table)
             created_files[gene_name] = output_file
             logger.info(
                 f"Created mutation clinical commentary for {gene_name} gene: {output_file}"
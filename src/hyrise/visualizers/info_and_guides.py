@@ -8,10 +8,10 @@ unified section of the MultiQC report.
 """
 
 import os
-import json
 import html
 from collections import defaultdict
 from hyrise import __version__
+from hyrise.core.file_utils import write_html_file, write_json_file
 from hyrise.utils.html_utils import (
     create_html_header,
     create_html_footer,
@@ -135,8 +135,7 @@ def create_sample_analysis_info(data, sample_id, formatted_date, output_dir):
 
         # Write to file
         output_file = os.path.join(output_dir, "sequence_validation_mqc.html")
-        with open(output_file, "w") as f:
-            f.write(html_content)
+        write_html_file(output_file, html_content)
 
 
 def create_interpretation_guides(output_dir):
@@ -246,8 +245,7 @@ def create_sample_info_table(
 
     # Write to file
     output_file = os.path.join(output_dir, "sample_info_table_mqc.json")
-    with open(output_file, "w") as f:
-        json.dump(table_json, f, indent=2)
+    write_json_file(output_file, table_json)
 
 
 def create_gene_info_table(data, sample_id, sequence_info, output_dir):
@@ -335,8 +333,7 @@ def create_gene_info_table(data, sample_id, sequence_info, output_dir):
 
     # Write to file
     output_file = os.path.join(output_dir, "gene_info_table_mqc.json")
-    with open(output_file, "w") as f:
-        json.dump(table_json, f, indent=2)
+    write_json_file(output_file, table_json)
 
 
 def create_resistance_interpretation_table(output_dir):
@@ -427,8 +424,7 @@ def create_resistance_interpretation_table(output_dir):
 
     # Write to file
     output_file = os.path.join(output_dir, "resistance_interpretation_table_mqc.json")
-    with open(output_file, "w") as f:
-        json.dump(table_json, f, indent=2)
+    write_json_file(output_file, table_json)
 
 
 def create_mutation_type_table(output_dir):
@@ -513,8 +509,7 @@ def create_mutation_type_table(output_dir):
 
     # Write to file
     output_file = os.path.join(output_dir, "mutation_type_table_mqc.json")
-    with open(output_file, "w") as f:
-        json.dump(table_json, f, indent=2)
+    write_json_file(output_file, table_json)
 
 
 def create_drug_class_info_table(output_dir):
@@ -607,8 +602,7 @@ def create_drug_class_info_table(output_dir):
 
     # Write to file
     output_file = os.path.join(output_dir, "drug_class_info_table_mqc.json")
-    with open(output_file, "w") as f:
-        json.dump(table_json, f, indent=2)
+    write_json_file(output_file, table_json)
 
 
 def create_unified_report_section(data, sample_id, formatted_date, output_dir):
@@ -713,5 +707,4 @@ def create_unified_report_section(data, sample_id, formatted_date, output_dir):
 
     # Write to file
     output_file = os.path.join(output_dir, "unified_report_section_mqc.html")
-    with open(output_file, "w") as f:
-        f.write(html_content)
+    write_html_file(output_file, html_content)
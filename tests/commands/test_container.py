@@ -4,12 +4,53 @@ from types import SimpleNamespace
 import hyrise.commands.container as container_module
 
 
-def test_add_container_subparser_sets_func():
+def make_args(**kwargs):
+    defaults = {
+        "def_file": None,
+        "extract_def": None,
+        "singularity": None,
+        "sudo": False,
+        "force": False,
+        "build_elsewhere": False,
+        "verbose": False,
+        "output": "hyrise.sif",
+    }
+    defaults.update(kwargs)
+    return SimpleNamespace(**defaults)
+
+
+@pytest.fixture(scope="module")
+def container_parser():
+    # parse_args() does not mutate the parser, so one instance serves the module
     parser = argparse.ArgumentParser()
     subparsers = parser.add_subparsers()
     container_module.add_container_subparser(subparsers)
+    return parser
+
+
+@pytest.fixture
+def stub_build_env(monkeypatch):
+    """Patch the container build dependencies with happy-path stubs.
+
+    Returns a callable; keyword arguments override individual stubs.
+    """
+
+    def apply(**stubs):
+        patches = {
+            "get_def_file_path": lambda: "/path/to/def.def",
+            "find_singularity_binary": lambda: "/usr/bin/singularity",
+            "verify_container": lambda output, singularity: True,
+        }
+        patches.update(stubs)
+        for name, stub in patches.items():
+            monkeypatch.setattr(container_module, name, stub)
+
+    return apply
+
+
+def test_add_container_subparser_sets_func(container_parser):
     # Parsing without required func should not error
-    args = parser.parse_args(["container"])
+    args = container_parser.parse_args(["container"])
     assert hasattr(args, "func")
     assert args.func == container_module.run_container_command
 
@@ -17,64 +58,25 @@ def test_add_container_subparser_sets_func():
 def test_run_container_command_no_def(monkeypatch, caplog):
     # Simulate missing definition file
     monkeypatch.setattr(container_module, "get_def_file_path", lambda: None)
-    args = SimpleNamespace(
-        def_file=None,
-        extract_def=None,
-        singularity=None,
-        sudo=False,
-        force=False,
-        build_elsewhere=False,
-        verbose=False,
-        output="hyrise.sif",
-    )
+    args = make_args()
     caplog.set_level("ERROR")
     result = container_module.run_container_command(args)
     assert result == 1
     assert "Could not find the HyRISE definition file" in caplog.text
 
 
-def test_extract_def_success(monkeypatch):
+def test_extract_def_success(stub_build_env):
     # Simulate extracting definition file successfully
-    monkeypatch.setattr(
-        container_module, "get_def_file_path", lambda: "/path/to/def.def"
-    )
-    monkeypatch.setattr(
-        container_module,
-        "copy_def_file_to_directory",
-        lambda dest, src: "/dest/def.def",
-    )
-    args = SimpleNamespace(
-        def_file=None,
-        extract_def="some/dir",
-        singularity=None,
-        sudo=False,
-        force=False,
-        build_elsewhere=False,
-        verbose=False,
-        output="hyrise.sif",
-    )
+    stub_build_env(copy_def_file_to_directory=lambda dest, src: "/dest/def.def")
+    args = make_args(extract_def="some/dir")
     result = container_module.run_container_command(args)
     assert result == 0
 
 
-def test_extract_def_failure(monkeypatch):
+def test_extract_def_failure(stub_build_env):
     # Simulate failure extracting definition file
-    monkeypatch.setattr(
-        container_module, "get_def_file_path", lambda: "/path/to/def.def"
-    )
-    monkeypatch.setattr(
-        container_module, "copy_def_file_to_directory", lambda dest, src: None
-    )
-    args = SimpleNamespace(
-        def_file=None,
-        extract_def="some/dir",
-        singularity=None,
-        sudo=False,
-        force=False,
-        build_elsewhere=False,
-        verbose=False,
-        output="hyrise.sif",
-    )
+    stub_build_env(copy_def_file_to_directory=lambda dest, src: None)
+    args = make_args(extract_def="some/dir")
     result = container_module.run_container_command(args)
     assert result == 1
 
@@ -88,172 +90,72 @@ def test_extract_dockerfile_success(monkeypatch):
         "copy_file_to_directory",
         lambda dest, src, output_name=None: "/dest/Dockerfile",
     )
-    args = SimpleNamespace(
-        extract_dockerfile="some/dir",
-        extract_def=None,
-        def_file=None,
-        verbose=False,
-        interactive=False,
-    )
+    args = make_args(extract_dockerfile="some/dir")
     result = container_module.run_container_command(args)
     assert result == 0
 
 
 def test_extract_dockerfile_missing_resource(monkeypatch):
     monkeypatch.setattr(container_module, "get_dockerfile_path", lambda: None)
-    args = SimpleNamespace(
-        extract_dockerfile="some/dir",
-        extract_def=None,
-        def_file=None,
-        verbose=False,
-        interactive=False,
-    )
+    args = make_args(extract_dockerfile="some/dir")
     result = container_module.run_container_command(args)
     assert result == 1
 
 
-def test_build_elsewhere_success_and_verify(monkeypatch):
+def test_build_elsewhere_success_and_verify(stub_build_env):
     # Simulate successful build elsewhere and verification
-    monkeypatch.setattr(
-        container_module, "get_def_file_path", lambda: "/path/to/def.def"
+    stub_build_env(
+        build_container=lambda def_file, output, singularity, sudo, force: True
     )
-    monkeypatch.setattr(
-        container_module, "find_singularity_binary", lambda: "/usr/bin/singularity"
-    )
-    monkeypatch.setattr(
-        container_module,
-        "build_container",
-        lambda def_file, output, singularity, sudo, force: True,
-    )
-    monkeypatch.setattr(
-        container_module, "verify_container", lambda output, singularity: True
-    )
-    args = SimpleNamespace(
-        def_file=None,
-        extract_def=None,
-        singularity=None,
-        sudo=True,
-        force=True,
-        build_elsewhere=True,
-        verbose=True,
-        output="out.sif",
+    args = make_args(
+        sudo=True, force=True, build_elsewhere=True, verbose=True, output="out.sif"
     )
     result = container_module.run_container_command(args)
     assert result == 0
 
 
-def test_build_elsewhere_build_failure(monkeypatch):
+def test_build_elsewhere_build_failure(stub_build_env):
     # Simulate build failure
-    monkeypatch.setattr(
-        container_module, "get_def_file_path", lambda: "/path/to/def.def"
-    )
-    monkeypatch.setattr(
-        container_module, "find_singularity_binary", lambda: "/usr/bin/singularity"
-    )
-    monkeypatch.setattr(
-        container_module,
-        "build_container",
-        lambda def_file, output, singularity, sudo, force: False,
-    )
-    args = SimpleNamespace(
-        def_file=None,
-        extract_def=None,
-        singularity=None,
-        sudo=False,
-        force=False,
-        build_elsewhere=True,
-        verbose=False,
-        output="out.sif",
+    stub_build_env(
+        build_container=lambda def_file, output, singularity, sudo, force: False
     )
+    args = make_args(build_elsewhere=True, output="out.sif")
     result = container_module.run_container_command(args)
     assert result == 1
 
 
-def test_build_elsewhere_verify_failure(monkeypatch):
+def test_build_elsewhere_verify_failure(stub_build_env):
     # Simulate verification failure after successful build
-    monkeypatch.setattr(
-        container_module, "get_def_file_path", lambda: "/path/to/def.def"
-    )
-    monkeypatch.setattr(
-        container_module, "find_singularity_binary", lambda: "/usr/bin/singularity"
-    )
-    monkeypatch.setattr(
-        container_module,
-        "build_container",
-        lambda def_file, output, singularity, sudo, force: True,
-    )
-    monkeypatch.setattr(
-        container_module, "verify_container", lambda output, singularity: False
-    )
-    args = SimpleNamespace(
-        def_file=None,
-        extract_def=None,
-        singularity=None,
-        sudo=False,
-        force=False,
-        build_elsewhere=True,
-        verbose=False,
-        output="out.sif",
+    stub_build_env(
+        build_container=lambda def_file, output, singularity, sudo, force: True,
+        verify_container=lambda output, singularity: False,
     )
+    args = make_args(build_elsewhere=True, output="out.sif")
     result = container_module.run_container_command(args)
     assert result == 1
 
 
-def test_build_in_def_directory_success(monkeypatch):
+def test_build_in_def_directory_success(stub_build_env):
     # Simulate building in definition directory and verification success
-    monkeypatch.setattr(
-        container_module, "get_def_file_path", lambda: "/path/to/def.def"
-    )
-    monkeypatch.setattr(
-        container_module, "find_singularity_binary", lambda: "/usr/bin/singularity"
-    )
-    monkeypatch.setattr(
-        container_module,
-        "build_container_in_def_directory",
-        lambda def_file, output_name, singularity_path, sudo, force: (
+    stub_build_env(
+        build_container_in_def_directory=lambda def_file, output_name, singularity_path, sudo, force: (
             True,
             "/path/to/def/hyrise.sif",
-        ),
-    )
-    monkeypatch.setattr(
-        container_module, "verify_container", lambda output, singularity: True
-    )
-    args = SimpleNamespace(
-        def_file=None,
-        extract_def=None,
-        singularity=None,
-        sudo=False,
-        force=False,
-        build_elsewhere=False,
-        verbose=False,
-        output="hyrise.sif",
+        )
     )
+    args = make_args()
     result = container_module.run_container_command(args)
     assert result == 0
 
 
-def test_build_in_def_directory_build_failure(monkeypatch):
+def test_build_in_def_directory_build_failure(stub_build_env):
     # Simulate build failure in definition directory
-    monkeypatch.setattr(
-        container_module, "get_def_file_path", lambda: "/path/to/def.def"
-    )
-    monkeypatch.setattr(
-        container_module, "find_singularity_binary", lambda: "/usr/bin/singularity"
-    )
-    monkeypatch.setattr(
-        container_module,
-        "build_container_in_def_directory",
-        lambda def_file, output_name, singularity_path, sudo, force: (False, None),
-    )
-    args = SimpleNamespace(
-        def_file=None,
-        extract_def=None,
-        singularity=None,
-        sudo=False,
-        force=False,
-        build_elsewhere=False,
-        verbose=False,
-        output="hyrise.sif",
+    stub_build_env(
+        build_container_in_def_directory=lambda def_file, output_name, singularity_path, sudo, force: (
+            False,
+            None,
+        )
     )
+    args = make_args()
     result = container_module.run_container_command(args)
     assert result == 1
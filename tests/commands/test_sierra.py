@@ -1,18 +1,64 @@
+import argparse
 import os
 import subprocess
 from types import SimpleNamespace
 
+import pytest
+
 import hyrise.commands.sierra as sierra_module
 import hyrise.core.processor as processor_module
 
 
-def test_add_sierra_subparser_sets_func():
-    import argparse
-
+# No sierra test should shell out; see the guard in conftest.py
+pytestmark = pytest.mark.usefixtures("no_real_subprocess")
+
+
+# Baseline sierra command arguments; tests override only the fields they exercise
+SIERRA_ARGS_DEFAULTS = {
+    "fasta": ["in.fa"],
+    "output": None,
+    "xml": None,
+    "json": None,
+    "cleanup": False,
+    "forceupdate": False,
+    "alignment": "post",
+    "container": None,
+    "no_container": None,
+    "process": False,
+    "run_multiqc": False,
+    "report": False,
+    "process_dir": None,
+    "guide": False,
+    "sample_info": False,
+    "contact_email": None,
+    "logo": None,
+    "container_path": None,
+    "container_runtime": None,
+    "resource_dir": None,
+    "verbose": False,
+}
+
+
+def make_args(**kwargs):
+    return SimpleNamespace(**{**SIERRA_ARGS_DEFAULTS, **kwargs})
+
+
+def patch_many(monkeypatch, target, **attrs):
+    for name, value in attrs.items():
+        monkeypatch.setattr(target, name, value)
+
+
+@pytest.fixture(scope="module")
+def sierra_parser():
+    # parse_args() does not mutate the parser, so one instance serves the module
     parser = argparse.ArgumentParser()
     subparsers = parser.add_subparsers()
     sierra_module.add_sierra_subparser(subparsers)
-    args = parser.parse_args(["sierra", "input.fa"])
+    return parser
+
+
+def test_add_sierra_subparser_sets_func(sierra_parser):
+    args = sierra_parser.parse_args(["sierra", "input.fa"])
     assert hasattr(args, "func")
     assert args.func == sierra_module.run_sierra_command
 
@@ -22,6 +68,8 @@ def test_bundled_hivdb_xml_default_exists():
     assert xml_path.exists()
     assert xml_path.name.startswith("HIVDB_")
     assert xml_path.suffix == ".xml"
+    # The package data lookup is cached for the life of the process
+    assert sierra_module._bundled_hivdb_xml_path() is xml_path
 
 
 def test_run_sierra_local_missing_fasta(tmp_path):
@@ -32,30 +80,21 @@ def test_run_sierra_local_missing_fasta(tmp_path):
     assert "FASTA file not found" in results["error"]
 
 
-def test_run_sierra_local_missing_xml(tmp_path):
-    # Create dummy fasta
-    fasta = tmp_path / "input.fa"
-    fasta.write_text(">seq\nATGC")
+def test_run_sierra_local_missing_xml(tmp_path, dummy_fasta):
     xml = str(tmp_path / "no.xml")
-    results = sierra_module.run_sierra_local([str(fasta)], xml=xml)
+    results = sierra_module.run_sierra_local([str(dummy_fasta)], xml=xml)
     assert not results["success"]
     assert "XML file not found" in results["error"]
 
 
-def test_run_sierra_local_missing_json_file(tmp_path):
-    # Create dummy fasta
-    fasta = tmp_path / "input.fa"
-    fasta.write_text(">seq\nATGC")
+def test_run_sierra_local_missing_json_file(tmp_path, dummy_fasta):
     json_file = str(tmp_path / "no.json")
-    results = sierra_module.run_sierra_local([str(fasta)], json_file=json_file)
+    results = sierra_module.run_sierra_local([str(dummy_fasta)], json_file=json_file)
     assert not results["success"]
     assert "JSON file not found" in results["error"]
 
 
-def test_run_sierra_local_native_success(monkeypatch, tmp_path):
-    # Setup dummy fasta and dependencies
-    fasta = tmp_path / "input.fa"
-    fasta.write_text(">seq\nATGC")
+def test_run_sierra_local_native_success(monkeypatch, tmp_path, dummy_fasta):
     output = tmp_path / "out.json"
     # Stub dependencies
     monkeypatch.setattr(
@@ -72,66 +111,61 @@ def test_run_sierra_local_native_success(monkeypatch, tmp_path):
 
     monkeypatch.setattr(subprocess, "run", fake_run)
 
-    results = sierra_module.run_sierra_local([str(fasta)], output=output_abs)
+    results = sierra_module.run_sierra_local([str(dummy_fasta)], output=output_abs)
     assert results["success"]
     assert results["output_path"] == output_abs
     assert not results["container_used"]
 
 
-def test_run_sierra_local_native_dependency_missing(monkeypatch, tmp_path):
-    # Setup dummy fasta
-    fasta = tmp_path / "input.fa"
-    fasta.write_text(">seq\nATGC")
+def test_run_sierra_local_native_dependency_missing(monkeypatch, dummy_fasta):
     # Stub dependencies to disable native and container
     monkeypatch.setattr(
         sierra_module,
         "ensure_dependencies",
         lambda **kwargs: {"use_container": False, "sierra_local_available": False},
     )
-    results = sierra_module.run_sierra_local([str(fasta)])
+    results = sierra_module.run_sierra_local([str(dummy_fasta)])
     assert not results["success"]
     assert "SierraLocal is not available" in results["error"]
 
 
-def test_run_sierra_local_container_success(monkeypatch, tmp_path):
-    # Setup dummy fasta and dependencies
-    fasta = tmp_path / "input.fa"
-    fasta.write_text(">seq\nATGC")
+def test_run_sierra_local_container_success(
+    monkeypatch, tmp_path, dummy_fasta, dummy_container
+):
     output = tmp_path / "out.json"
-    container = tmp_path / "hyrise.sif"
-    container.write_text("image")
     # Stub dependencies
     monkeypatch.setattr(
         sierra_module,
         "ensure_dependencies",
         lambda **kwargs: {
             "use_container": True,
-            "container_path": str(container),
+            "container_path": dummy_container,
             "sierra_local_available": True,
             "runtime_path": "/usr/bin/apptainer",
         },
     )
 
+    # The container writes its result under the bind directory using the
+    # basename of the requested output path
+    output_name = os.path.basename(str(output))
+
     # Stub subprocess.run to create file in temp directory
     def fake_run(cmd_list, check):
         # temp_dir is the bind path argument following --bind
         bind_idx = cmd_list.index("--bind")
         temp_dir = cmd_list[bind_idx + 1]
-        output_name = os.path.basename(str(output))
         temp_output = os.path.join(temp_dir, output_name)
         open(temp_output, "w").close()
 
     monkeypatch.setattr(subprocess, "run", fake_run)
 
-    results = sierra_module.run_sierra_local([str(fasta)], output=str(output))
+    results = sierra_module.run_sierra_local([str(dummy_fasta)], output=str(output))
     assert results["success"]
     assert results["container_used"]
     assert results["output_path"] == str(output)
 
 
-def test_run_sierra_local_native_output_directory(monkeypatch, tmp_path):
-    fasta = tmp_path / "input.fa"
-    fasta.write_text(">seq\nATGC")
+def test_run_sierra_local_native_output_directory(monkeypatch, tmp_path, dummy_fasta):
     output_dir = tmp_path / "outdir"
     output_dir.mkdir()
     expected_output = output_dir / "input_NGS_results.json"
@@ -149,27 +183,25 @@ def test_run_sierra_local_native_output_directory(monkeypatch, tmp_path):
 
     monkeypatch.setattr(subprocess, "run", fake_run)
 
-    results = sierra_module.run_sierra_local([str(fasta)], output=str(output_dir))
+    results = sierra_module.run_sierra_local([str(dummy_fasta)], output=str(output_dir))
     assert results["success"]
     assert results["output_path"] == str(expected_output.resolve())
     assert expected_output.exists()
 
 
-def test_run_sierra_local_container_output_directory(monkeypatch, tmp_path):
-    fasta = tmp_path / "input.fa"
-    fasta.write_text(">seq\nATGC")
+def test_run_sierra_local_container_output_directory(
+    monkeypatch, tmp_path, dummy_fasta, dummy_container
+):
     output_dir = tmp_path / "outdir"
     output_dir.mkdir()
     expected_output = output_dir / "input_NGS_results.json"
-    container = tmp_path / "hyrise.sif"
-    container.write_text("image")
 
     monkeypatch.setattr(
         sierra_module,
         "ensure_dependencies",
         lambda **kwargs: {
             "use_container": True,
-            "container_path": str(container),
+            "container_path": dummy_container,
             "sierra_local_available": True,
             "runtime_path": "/usr/bin/apptainer",
         },
@@ -185,7 +217,7 @@ def test_run_sierra_local_container_output_directory(monkeypatch, tmp_path):
 
     monkeypatch.setattr(subprocess, "run", fake_run)
 
-    results = sierra_module.run_sierra_local([str(fasta)], output=str(output_dir))
+    results = sierra_module.run_sierra_local([str(dummy_fasta)], output=str(output_dir))
     assert results["success"]
     assert results["container_used"]
     assert results["output_path"] == str(expected_output.resolve())
@@ -199,32 +231,15 @@ def test_run_sierra_command_error_propagation(monkeypatch, caplog):
         "run_sierra_local",
         lambda *args, **kwargs: {"success": False, "error": "fail"},
     )
-    # Prepare args
-    args = SimpleNamespace(
-        fasta=["in.fa"],
-        output=None,
-        xml=None,
-        json=None,
-        cleanup=False,
-        forceupdate=False,
-        alignment="post",
-        container=None,
-        no_container=None,
-        process=False,
-        run_multiqc=False,
-        report=False,
-        process_dir=None,
-        container_path=None,
-        container_runtime=None,
-        resource_dir=None,
-        verbose=False,
-    )
+    args = make_args()
     caplog.set_level("ERROR")
     result = sierra_module.run_sierra_command(args)
     assert result == 1
-    assert "Error: fail" in caplog.text
-    assert result == 1
-    assert "Error: fail" in caplog.text
+    # The failure is reported as an ERROR record, not just somewhere in the log
+    assert any(
+        record.levelname == "ERROR" and "Error: fail" in record.getMessage()
+        for record in caplog.records
+    )
 
 
 def test_run_sierra_command_success_without_process(monkeypatch):
@@ -234,76 +249,25 @@ def test_run_sierra_command_success_without_process(monkeypatch):
         "run_sierra_local",
         lambda *args, **kwargs: {"success": True, "output_path": "path"},
     )
-    # Prepare args with no processing
-    args = SimpleNamespace(
-        fasta=["in.fa"],
-        output=None,
-        xml=None,
-        json=None,
-        cleanup=False,
-        forceupdate=False,
-        alignment="post",
-        container=None,
-        no_container=None,
-        process=False,
-        run_multiqc=False,
-        report=False,
-        process_dir=None,
-        container_path=None,
-        container_runtime=None,
-        resource_dir=None,
-        verbose=False,
-    )
-    result = sierra_module.run_sierra_command(args)
-    assert result == 0
-
-
-def test_run_sierra_command_prefers_latest_downloaded_xml(monkeypatch, tmp_path):
-    latest_xml = tmp_path / "HIVDB_10.1.xml"
-    latest_xml.write_text("<xml/>")
-    captured = {}
-
-    def fake_run_sierra_local(*_args, **kwargs):
-        captured["xml"] = kwargs["xml"]
-        return {"success": True, "output_path": "path"}
-
-    monkeypatch.setattr(sierra_module, "run_sierra_local", fake_run_sierra_local)
-    monkeypatch.setattr(
-        sierra_module,
-        "get_latest_resource_path",
-        lambda resource_type, resource_dir=None: (
-            str(latest_xml) if resource_type == "hivdb_xml" else None
-        ),
-    )
-
-    args = SimpleNamespace(
-        fasta=["in.fa"],
-        output=None,
-        xml=str(sierra_module._bundled_hivdb_xml_path()),
-        json=None,
-        cleanup=False,
-        forceupdate=False,
-        alignment="post",
-        container=None,
-        no_container=None,
-        process=False,
-        run_multiqc=False,
-        report=False,
-        process_dir=None,
-        container_path=None,
-        container_runtime=None,
-        resource_dir=str(tmp_path),
-        verbose=False,
-    )
-
+    args = make_args()
     result = sierra_module.run_sierra_command(args)
     assert result == 0
-    assert captured["xml"] == str(latest_xml.resolve())
 
 
-def test_run_sierra_command_preserves_explicit_xml(monkeypatch, tmp_path):
-    explicit_xml = tmp_path / "custom.xml"
-    explicit_xml.write_text("<xml/>")
+@pytest.mark.parametrize(
+    "explicit_xml, expect_latest",
+    [
+        # The bundled default XML is swapped for the latest downloaded one
+        (False, True),
+        # A user-supplied XML is passed through unchanged
+        (True, False),
+    ],
+)
+def test_run_sierra_command_xml_selection(
+    monkeypatch, tmp_path, explicit_xml, expect_latest
+):
+    custom_xml = tmp_path / "custom.xml"
+    custom_xml.write_text("<xml/>")
     latest_xml = tmp_path / "HIVDB_10.1.xml"
     latest_xml.write_text("<xml/>")
     captured = {}
@@ -312,38 +276,26 @@ def test_run_sierra_command_preserves_explicit_xml(monkeypatch, tmp_path):
         captured["xml"] = kwargs["xml"]
         return {"success": True, "output_path": "path"}
 
-    monkeypatch.setattr(sierra_module, "run_sierra_local", fake_run_sierra_local)
-    monkeypatch.setattr(
+    patch_many(
+        monkeypatch,
         sierra_module,
-        "get_latest_resource_path",
-        lambda resource_type, resource_dir=None: (
+        run_sierra_local=fake_run_sierra_local,
+        get_latest_resource_path=lambda resource_type, resource_dir=None: (
             str(latest_xml) if resource_type == "hivdb_xml" else None
         ),
     )
 
-    args = SimpleNamespace(
-        fasta=["in.fa"],
-        output=None,
-        xml=str(explicit_xml),
-        json=None,
-        cleanup=False,
-        forceupdate=False,
-        alignment="post",
-        container=None,
-        no_container=None,
-        process=False,
-        run_multiqc=False,
-        report=False,
-        process_dir=None,
-        container_path=None,
-        container_runtime=None,
-        resource_dir=str(tmp_path),
-        verbose=False,
+    xml = (
+        str(custom_xml)
+        if explicit_xml
+        else str(sierra_module._bundled_hivdb_xml_path())
     )
+    args = make_args(xml=xml, resource_dir=str(tmp_path))
 
     result = sierra_module.run_sierra_command(args)
     assert result == 0
-    assert captured["xml"] == str(explicit_xml)
+    expected = str(latest_xml.resolve()) if expect_latest else str(custom_xml)
+    assert captured["xml"] == expected
 
 
 def test_run_sierra_command_defaults_json_into_process_dir(monkeypatch, tmp_path):
@@ -353,37 +305,21 @@ def test_run_sierra_command_defaults_json_into_process_dir(monkeypatch, tmp_path
         captured["output_arg"] = kwargs["output"]
         return {"success": True, "output_path": kwargs["output"]}
 
-    monkeypatch.setattr(sierra_module, "run_sierra_local", fake_run_sierra_local)
-    monkeypatch.setattr(
-        sierra_module, "_prefer_latest_downloaded_hivdb_xml", lambda xml, **_: xml
+    patch_many(
+        monkeypatch,
+        sierra_module,
+        run_sierra_local=fake_run_sierra_local,
+        _prefer_latest_downloaded_hivdb_xml=lambda xml, **_: xml,
     )
     monkeypatch.setattr(
         processor_module, "process_files", lambda *args, **kwargs: {"files_generated": []}
     )
 
     process_dir = tmp_path / "report_example"
-    args = SimpleNamespace(
+    args = make_args(
         fasta=[str(tmp_path / "DEMO_COMBO_NGS.fasta")],
-        output=None,
-        xml=None,
-        json=None,
-        cleanup=False,
-        forceupdate=False,
-        alignment="post",
-        container=None,
-        no_container=None,
         process=True,
-        run_multiqc=False,
-        report=False,
         process_dir=str(process_dir),
-        guide=False,
-        sample_info=False,
-        contact_email=None,
-        logo=None,
-        container_path=None,
-        container_runtime=None,
-        resource_dir=None,
-        verbose=False,
     )
 
     result = sierra_module.run_sierra_command(args)
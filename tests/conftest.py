@@ -0,0 +1,113 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Stdlib parser on 3.11+; tomli only where the project still supports 3.9/3.10
+if sys.version_info >= (3, 11):
+    import tomllib
+else:  # pragma: no cover
+    import tomli as tomllib
+
+
+# Memory-backed filesystem for tmp_path; opt in with HYRISE_TEST_TMPFS=1
+TMPFS_ENV_VAR = "HYRISE_TEST_TMPFS"
+TMPFS_ROOT = "/dev/shm"
+# Docker caps /dev/shm at 64 MiB by default, so require more headroom than that
+TMPFS_MIN_FREE_BYTES = 256 * 1024 * 1024
+TMPFS_BASETEMP_KEY = pytest.StashKey[str]()
+SESSION_FAILED_KEY = pytest.StashKey[bool]()
+
+PYPROJECT_PATH = Path(__file__).resolve().parents[1] / "pyproject.toml"
+
+
+def _tmpfs_usable():
+    try:
+        return shutil.disk_usage(TMPFS_ROOT).free >= TMPFS_MIN_FREE_BYTES
+    except OSError:
+        return False
+
+
+def pytest_configure(config):
+    # Put tmp_path on tmpfs so the file-heavy report tests skip disk I/O. Only
+    # on request, never over an explicit --basetemp, and only when there is
+    # room; xdist workers inherit the controller's basetemp.
+    if (
+        os.environ.get(TMPFS_ENV_VAR) != "1"
+        or config.option.basetemp
+        or hasattr(config, "workerinput")
+        or not sys.platform.startswith("linux")
+        or not os.access(TMPFS_ROOT, os.W_OK)
+        or not _tmpfs_usable()
+    ):
+        return
+    # A fresh directory per run keeps concurrent runs from clearing each other
+    basetemp = tempfile.mkdtemp(prefix="pytest-", dir=TMPFS_ROOT)
+    config.option.basetemp = basetemp
+    config.stash[TMPFS_BASETEMP_KEY] = basetemp
+
+
+def pytest_sessionfinish(session, exitstatus):
+    session.config.stash[SESSION_FAILED_KEY] = exitstatus != 0
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    basetemp = config.stash.get(TMPFS_BASETEMP_KEY, None)
+    if basetemp and exitstatus != 0:
+        terminalreporter.write_line(
+            f"Kept temporary files of the failed run in {basetemp}"
+        )
+
+
+def pytest_unconfigure(config):
+    # tmpfs is RAM, so a passing run's directory is removed; a failing run's
+    # is kept for inspection, like pytest's own retained basetemps
+    basetemp = config.stash.get(TMPFS_BASETEMP_KEY, None)
+    if not basetemp:
+        return
+    if config.stash.get(SESSION_FAILED_KEY, True):
+        return
+    shutil.rmtree(basetemp, ignore_errors=True)
+
+
+def _unexpected_subprocess_run(cmd, *args, **kwargs):
+    raise AssertionError(f"unexpected real subprocess.run call: {cmd}")
+
+
+@pytest.fixture
+def no_real_subprocess(monkeypatch):
+    # Fails any test that would shell out; tests that expect a call patch
+    # their own fake run on top of this guard with monkeypatch.
+    monkeypatch.setattr(subprocess, "run", _unexpected_subprocess_run)
+
+
+@pytest.fixture(scope="session")
+def dummy_fasta(tmp_path_factory):
+    # Read-only input shared by every test that only needs an existing FASTA
+    fasta = tmp_path_factory.mktemp("fasta") / "input.fa"
+    fasta.write_text(">seq\nATGC")
+    return fasta
+
+
+@pytest.fixture(scope="session")
+def dummy_container(tmp_path_factory):
+    # Placeholder image for tests that stub the container runtime
+    container = tmp_path_factory.mktemp("container") / "hyrise.sif"
+    container.write_text("image")
+    return str(container)
+
+
+@pytest.fixture(scope="session")
+def pyproject_data():
+    # pyproject.toml is read and parsed once for every metadata test
+    with PYPROJECT_PATH.open("rb") as handle:
+        return tomllib.load(handle)
+
+
+@pytest.fixture(scope="session")
+def project(pyproject_data):
+    return pyproject_data["project"]
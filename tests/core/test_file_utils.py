@@ -2,7 +2,12 @@ import os
 import json
 import pytest
 
-from hyrise.core.file_utils import extract_sample_id, load_json_file
+from hyrise.core.file_utils import (
+    extract_sample_id,
+    load_json_file,
+    write_html_file,
+    write_json_file,
+)
 from hyrise.utils.html_utils import create_html_header, create_html_footer
 
 
@@ -30,6 +35,22 @@ def test_extract_sample_id_variants(filename, expected):
 # -----------------------------
 
 
+DICT_PAYLOAD = {"a": 1, "b": 2}
+LIST_PAYLOAD = [{"x": 10}, {"x": 20}]
+
+
+@pytest.fixture(scope="session")
+def json_inputs(tmp_path_factory):
+    # load_json_file only reads its input, so the files are written once
+    base = tmp_path_factory.mktemp("json_inputs")
+    paths = {}
+    for name, payload in (("dict", DICT_PAYLOAD), ("list", LIST_PAYLOAD)):
+        path = base / f"{name}.json"
+        path.write_text(json.dumps(payload))
+        paths[name] = str(path)
+    return paths
+
+
 def test_load_json_file_not_found(tmp_path):
     missing = tmp_path / "no_such.json"
     with pytest.raises(FileNotFoundError) as exc:
@@ -37,36 +58,38 @@ def test_load_json_file_not_found(tmp_path):
     assert "not found" in str(exc.value)
 
 
-def test_load_json_file_dict(tmp_path):
-    data = {"a": 1, "b": 2}
-    f = tmp_path / "data.json"
-    f.write_text(json.dumps(data))
-
-    # preserve_list=True should return the dict unchanged
-    loaded = load_json_file(str(f), preserve_list=True)
-    assert isinstance(loaded, dict)
-    assert loaded == data
+@pytest.mark.parametrize(
+    "name,preserve_list,expected",
+    [
+        # A dict is returned unchanged either way
+        ("dict", True, DICT_PAYLOAD),
+        ("dict", False, DICT_PAYLOAD),
+        # A list is kept whole, or reduced to its first element
+        ("list", True, LIST_PAYLOAD),
+        ("list", False, LIST_PAYLOAD[0]),
+    ],
+)
+def test_load_json_file_variants(json_inputs, name, preserve_list, expected):
+    loaded = load_json_file(json_inputs[name], preserve_list=preserve_list)
+    assert type(loaded) is type(expected)
+    assert loaded == expected
 
-    # preserve_list=False on a dict should also return it unchanged
-    loaded2 = load_json_file(str(f), preserve_list=False)
-    assert isinstance(loaded2, dict)
-    assert loaded2 == data
 
+def test_write_json_file_round_trips_compact_utf8(tmp_path):
+    payload = {"id": "table", "data": [{"Gene": "RT", "Note": "β-lactam"}]}
+    out = tmp_path / "table_mqc.json"
+    write_json_file(str(out), payload)
 
-def test_load_json_file_list(tmp_path):
-    data = [{"x": 10}, {"x": 20}]
-    f = tmp_path / "list.json"
-    f.write_text(json.dumps(data))
+    raw = out.read_bytes()
+    assert b", " not in raw and b": " not in raw
+    assert "β".encode("utf-8") in raw
+    assert json.loads(raw.decode("utf-8")) == payload
 
-    # preserve_list=True returns the full list
-    loaded = load_json_file(str(f), preserve_list=True)
-    assert isinstance(loaded, list)
-    assert loaded == data
 
-    # preserve_list=False returns only the first element
-    loaded_first = load_json_file(str(f), preserve_list=False)
-    assert isinstance(loaded_first, dict)
-    assert loaded_first == data[0]
+def test_write_html_file_writes_utf8(tmp_path):
+    out = tmp_path / "section_mqc.html"
+    write_html_file(str(out), "<p>β-lactam</p>")
+    assert out.read_bytes() == "<p>β-lactam</p>".encode("utf-8")
 
 
 # --------------------------------
@@ -1,5 +1,4 @@
 import os
-import json
 import shutil
 import subprocess
 from datetime import datetime
@@ -9,290 +8,170 @@ from types import SimpleNamespace
 import hyrise.core.processor as processor_module
 
 
-@pytest.fixture(autouse=True)
-def stub_visualizations_and_dependencies(monkeypatch, tmp_path):
-    # Stub ensure_dependencies to default native no multiqc
-    monkeypatch.setattr(
-        processor_module,
-        "ensure_dependencies",
-        lambda *args, **kwargs: {
-            "use_container": False,
-            "container_path": None,
-            "multiqc_available": False,
-        },
-    )
+# Visualization functions process_files calls for every processed sequence
+VIS_FUNCS = (
+    "create_drug_resistance_profile",
+    "create_drug_class_resistance_summary",
+    "create_mutation_resistance_contribution",
+    "create_mutation_clinical_commentary",
+    "create_mutation_details_table",
+    "create_mutation_position_visualization",
+    "create_mutation_type_summary",
+)
+
+
+# One processable sequence as load_json_file returns it; process_files only
+# reads it, so every test can share the same list
+SAMPLE_ENTRIES = [
+    {
+        "inputSequence": {"header": "H1"},
+        "alignedGeneSequences": [
+            {
+                "gene": {"name": "G"},
+                "firstAA": 1,
+                "lastAA": 1,
+                "mutations": [],
+                "SDRMs": [],
+            }
+        ],
+        "drugResistance": [{}],
+        "validationResults": [],
+    }
+]
 
-    # Stub visualization functions to create dummy '_mqc.json' files
-    def make_stub(func_name):
-        def stub(data, sample_name, *args, **kwargs):
-            # args[-1] is output_dir
-            output_dir = args[-1] if args else kwargs.get("output_dir")
-            filepath = os.path.join(output_dir, f"{sample_name}_{func_name}_mqc.json")
-            with open(filepath, "w") as f:
-                f.write("{}")
-
-        return stub
-
-    vis_funcs = [
-        "create_drug_resistance_profile",
-        "create_drug_class_resistance_summary",
-        "create_mutation_resistance_contribution",
-        "create_mutation_clinical_commentary",
-        "create_mutation_details_table",
-        "create_mutation_position_visualization",
-        "create_mutation_type_summary",
-    ]
-    for fn in vis_funcs:
-        monkeypatch.setattr(processor_module, fn, make_stub(fn))
-    # Stub info and guide
-    monkeypatch.setattr(
-        processor_module,
-        "create_unified_report_section",
-        lambda data, sample_name, formatted_date, output_dir: open(
-            os.path.join(output_dir, f"{sample_name}_guide_mqc.json"), "w"
-        ).close(),
-    )
-    monkeypatch.setattr(
-        processor_module,
-        "create_sample_analysis_info",
-        lambda data, sample_name, formatted_date, output_dir: open(
-            os.path.join(output_dir, f"{sample_name}_info_mqc.json"), "w"
-        ).close(),
-    )
-    yield
+# Paths the visualization stubs "wrote"; cleared before every test
+WRITTEN = set()
 
 
-def write_json(tmp_path, data):
-    json_file = tmp_path / "sample.json"
-    json_file.write_text(json.dumps(data))
-    return str(json_file)
+def make_stub(func_name, virtual=False):
+    # Stub a visualization function to create a dummy '_mqc.json' file, or
+    # only record its path in WRITTEN when the test never reads it from disk
+    def stub(data, sample_name, *args, **kwargs):
+        # args[-1] is output_dir
+        output_dir = args[-1] if args else kwargs.get("output_dir")
+        filepath = os.path.join(output_dir, f"{sample_name}_{func_name}_mqc.json")
+        if virtual:
+            WRITTEN.add(filepath)
+            return
+        # Only existence is checked, so a bare touch is enough
+        os.close(os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
 
+    return stub
 
-@pytest.fixture(autouse=True)
-def stub_dependencies(monkeypatch):
-    # Prevent ensure_dependencies from raising or invoking containers
-    monkeypatch.setattr(
-        processor_module,
-        "ensure_dependencies",
-        lambda *args, **kwargs: {
-            "use_container": False,
-            "multiqc_available": False,
-        },
-    )
 
+def assert_written(path):
+    assert str(path) in WRITTEN, f"Missing {path}"
 
-def make_stub_writer(fn_name):
-    """
-    Return a stub function that writes an empty {sample_name}_{fn_name}_mqc.json
-    into the output_dir when called.
-    """
 
-    def stub(data_item, sample_name, output_dir, *args, **kwargs):
-        os.makedirs(output_dir, exist_ok=True)
-        out_path = os.path.join(output_dir, f"{sample_name}_{fn_name}_mqc.json")
-        with open(out_path, "w") as f:
-            json.dump({}, f)
+# The stubs hold no state, so they are built once and reused by every test.
+# Guide and info files stay on disk because process_files collects them into
+# files_generated by walking the output directory.
+VIS_STUBS = {
+    **{fn: make_stub(fn, virtual=True) for fn in VIS_FUNCS},
+    "create_unified_report_section": make_stub("guide"),
+    "create_sample_analysis_info": make_stub("info"),
+}
 
-    return stub
 
+def stub_dependencies(*args, **kwargs):
+    # Default native run without multiqc
+    return {
+        "use_container": False,
+        "container_path": None,
+        "multiqc_available": False,
+    }
 
-def test_process_files_basic(tmp_path, monkeypatch):
-    # 1) Create a dummy JSON file name so extract_sample_id returns "sample"
-    sample_json = tmp_path / "sample_NGS_results.json"
-    sample_json.write_text("{}")
 
-    # 2) Stub load_json_file to return one entry that WILL be processed
-    monkeypatch.setattr(
-        processor_module,
-        "load_json_file",
-        lambda path, preserve_list=True: [
-            {
-                "inputSequence": {"header": "H1"},
-                "alignedGeneSequences": [
-                    {
-                        "gene": {"name": "G"},
-                        "firstAA": 1,
-                        "lastAA": 1,
-                        "mutations": [],
-                        "SDRMs": [],
-                    }
-                ],
-                "drugResistance": [{}],
-                "validationResults": [],
-            }
-        ],
-    )
+@pytest.fixture(autouse=True)
+def stub_visualizations_and_dependencies(monkeypatch):
+    # Tests that need different behaviour patch on top of this through the
+    # same monkeypatch, so every stub is undone together
+    for name, value in {"ensure_dependencies": stub_dependencies, **VIS_STUBS}.items():
+        monkeypatch.setattr(processor_module, name, value)
+    WRITTEN.clear()
 
-    # 3) Stub ensure_dependencies to a no‑op
-    monkeypatch.setattr(
-        processor_module,
-        "ensure_dependencies",
-        lambda *args, **kwargs: {
-            "use_container": False,
-            "multiqc_available": False,
-        },
-    )
 
-    # 4) Stub each visualization function to write a fake _mqc.json file
-    def make_stub(fn_name):
-        def stub(data, sample_name, output_dir, *args, **kwargs):
-            os.makedirs(output_dir, exist_ok=True)
-            with open(
-                os.path.join(output_dir, f"{sample_name}_{fn_name}_mqc.json"), "w"
-            ) as f:
-                f.write("{}")
-
-        return stub
-
-    viz_fns = [
-        "create_drug_resistance_profile",
-        "create_drug_class_resistance_summary",
-        "create_mutation_resistance_contribution",
-        "create_mutation_clinical_commentary",
-        "create_mutation_details_table",
-        "create_mutation_position_visualization",
-        "create_mutation_type_summary",
-    ]
-    for fn in viz_fns:
-        monkeypatch.setattr(processor_module, fn, make_stub(fn))
-
-    # 5) Run process_files
-    output_dir = tmp_path / "out"
-    results = processor_module.process_files(
-        json_file=str(sample_json),
-        output_dir=str(output_dir),
-    )
+# Pre-serialized input for tests that only need some JSON file on disk
+MINIMAL_JSON_PAYLOAD = b'{"a": 1}'
 
-    # 6a) sample_name should be “sample”
-    assert results["sample_name"] == "sample"
 
-    # 6b) Each stub produced its _mqc.json file
-    for fn in viz_fns:
-        p = output_dir / f"sample_{fn}_mqc.json"
-        assert p.exists(), f"Missing {p}"
+def write_json(tmp_path, payload=MINIMAL_JSON_PAYLOAD):
+    json_file = tmp_path / "sample.json"
+    json_file.write_bytes(payload)
+    return str(json_file)
 
 
-def test_process_files_with_guide_and_sample_info(tmp_path, monkeypatch):
-    # 1) Create a dummy JSON file so extract_sample_id -> "sample"
-    sample_json = tmp_path / "sample_NGS_results.json"
-    sample_json.write_text("{}")
+@pytest.fixture(scope="session")
+def sample_json(tmp_path_factory):
+    # Read-only input named so extract_sample_id returns "sample"
+    json_file = tmp_path_factory.mktemp("in") / "sample_NGS_results.json"
+    json_file.write_text("{}")
+    return json_file
 
-    # 2) Stub load_json_file to return one processable entry
-    monkeypatch.setattr(
-        processor_module,
-        "load_json_file",
-        lambda path, preserve_list=True: [
-            {
-                "inputSequence": {"header": "H1"},
-                "alignedGeneSequences": [
-                    {
-                        "gene": {"name": "G"},
-                        "firstAA": 1,
-                        "lastAA": 1,
-                        "mutations": [],
-                        "SDRMs": [],
-                    }
-                ],
-                "drugResistance": [{}],
-                "validationResults": [],
-            }
-        ],
-    )
 
-    # 3) Stub ensure_dependencies so nothing blows up
+@pytest.mark.parametrize("guide, sample_info", [(False, False), (True, True)])
+def test_process_files(tmp_path, monkeypatch, sample_json, guide, sample_info):
+    # 1) Stub load_json_file to return one entry that WILL be processed
     monkeypatch.setattr(
         processor_module,
-        "ensure_dependencies",
-        lambda *args, **kwargs: {
-            "use_container": False,
-            "multiqc_available": False,
-        },
+        "load_json_file",
+        lambda path, preserve_list=True: SAMPLE_ENTRIES,
     )
 
-    # 4) Stub the core viz functions to no‑ops
-    for fn in [
-        "create_drug_resistance_profile",
-        "create_drug_class_resistance_summary",
-        "create_mutation_resistance_contribution",
-        "create_mutation_clinical_commentary",
-        "create_mutation_details_table",
-        "create_mutation_position_visualization",
-        "create_mutation_type_summary",
-    ]:
-        monkeypatch.setattr(processor_module, fn, lambda *args, **kwargs: None)
-
-    # 5) Stub guide + info to write actual files
-    def stub_guide(data_item, sample_name, formatted_date, output_dir):
-        os.makedirs(output_dir, exist_ok=True)
-        open(os.path.join(output_dir, f"{sample_name}_guide_mqc.json"), "w").close()
-
-    def stub_info(data_item, sample_name, formatted_date, output_dir):
-        os.makedirs(output_dir, exist_ok=True)
-        open(os.path.join(output_dir, f"{sample_name}_info_mqc.json"), "w").close()
-
-    monkeypatch.setattr(processor_module, "create_unified_report_section", stub_guide)
-    monkeypatch.setattr(processor_module, "create_sample_analysis_info", stub_info)
-
-    # 6) Run with guide + sample_info
+    # 2) Run process_files; the autouse fixture stubs every visualization
+    # and writes the guide/info files when they are requested
     output_dir = tmp_path / "out"
     results = processor_module.process_files(
         json_file=str(sample_json),
         output_dir=str(output_dir),
-        guide=True,
-        sample_info=True,
+        guide=guide,
+        sample_info=sample_info,
     )
 
-    # 7a) Check that the stub files exist
-    guide_path = output_dir / "sample_guide_mqc.json"
-    info_path = output_dir / "sample_info_mqc.json"
-    assert guide_path.exists(), f"Expected {guide_path} to be created"
-    assert info_path.exists(), f"Expected {info_path} to be created"
+    # 3a) sample_name should be “sample”
+    assert results["sample_name"] == "sample"
 
-    # 7b) And that they were recorded in results["files_generated"]
-    assert str(guide_path) in results["files_generated"]
-    assert str(info_path) in results["files_generated"]
+    # 3b) Each stub produced its _mqc.json file
+    for fn in VIS_FUNCS:
+        assert_written(output_dir / f"sample_{fn}_mqc.json")
 
+    # 3c) Guide and info files exist only when requested, and are then
+    # recorded in results["files_generated"]
+    for requested, name in ((guide, "guide"), (sample_info, "info")):
+        path = output_dir / f"sample_{name}_mqc.json"
+        assert path.exists() == requested, f"Unexpected state for {path}"
+        assert (str(path) in results["files_generated"]) == requested
 
-def test_generate_report_config_only(tmp_path, monkeypatch):
-    json_file = write_json(tmp_path, {"a": 1})
-    output_dir = tmp_path / "out"
 
-    # 1) Stub ensure_dependencies
-    monkeypatch.setattr(
-        processor_module,
-        "ensure_dependencies",
-        lambda *args, **kwargs: {
-            "use_container": False,
-            "container_path": None,
-            "multiqc_available": False,
-        },
-    )
+class FakeConfigGen:
+    # Fake report generator with full __init__ signature
+    def __init__(self, output_dir, version, sample_name, metadata_info, contact_email):
+        # record where we'll write the config
+        self.config_path = os.path.join(output_dir, "config.yml")
 
-    # 2) Fake report generator with full __init__ signature
-    class FakeGen:
-        def __init__(
-            self, output_dir, version, sample_name, metadata_info, contact_email
-        ):
-            # record where we'll write the config
-            self.config_path = os.path.join(output_dir, "config.yml")
+    def generate_config(self):
+        # ensure the out dir exists (process_files already did this)
+        os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
+        with open(self.config_path, "w") as f:
+            f.write("config")
+        return self.config_path
 
-        def generate_config(self):
-            # ensure the out dir exists (process_files already did this)
-            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-            with open(self.config_path, "w") as f:
-                f.write("config")
-            return self.config_path
 
-    monkeypatch.setattr(processor_module, "HyRISEReportGenerator", FakeGen)
+def test_generate_report_config_only(tmp_path, monkeypatch):
+    json_file = write_json(tmp_path)
+    output_dir = tmp_path / "out"
+
+    # 1) Fake report generator that only writes a config file
+    monkeypatch.setattr(processor_module, "HyRISEReportGenerator", FakeConfigGen)
 
-    # 3) Stub load_json_file so process_sequences doesn't error
+    # 2) Stub load_json_file so process_sequences doesn't error
     monkeypatch.setattr(
         processor_module,
         "load_json_file",
         lambda path, preserve_list=True: [],
     )
 
-    # 4) Run with generate_report=True but run_multiqc=False
+    # 3) Run with generate_report=True but run_multiqc=False
     results = processor_module.process_files(
         json_file=str(json_file),
         output_dir=str(output_dir),
@@ -301,7 +180,7 @@ def test_generate_report_config_only(tmp_path, monkeypatch):
         contact_email="test@example.com",
     )
 
-    # 5) Now config_file must be set to our dummy path
+    # 4) Now config_file must be set to our dummy path
     expected = os.path.join(str(output_dir), "config.yml")
     assert results["config_file"] == expected
     # And the file must exist on disk
@@ -1,21 +1,28 @@
+import runpy
 import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
+import hyrise.cli as cli
+
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
 
-def test_cli_entrypoints_help():
-    module_help = subprocess.run(
-        [sys.executable, "-m", "hyrise", "--help"],
-        check=False,
-        capture_output=True,
-        text=True,
-    )
-    assert module_help.returncode == 0
-    assert "HyRISE" in module_help.stdout
+def test_module_entrypoint_help(monkeypatch, capsys):
+    # Run ``python -m hyrise --help`` in-process instead of spawning a new
+    # interpreter; --help exits through argparse with code 0
+    monkeypatch.setattr(sys, "argv", ["hyrise", "--help"])
+    with pytest.raises(SystemExit) as exc:
+        runpy.run_module("hyrise", run_name="__main__")
+    assert exc.value.code == 0
+    assert "HyRISE" in capsys.readouterr().out
+
 
+def test_console_script_installed():
+    # The one real subprocess: guards the console script registration
     script_help = subprocess.run(
         ["hyrise", "--help"],
         check=False,
@@ -26,14 +33,16 @@ def test_cli_entrypoints_help():
     assert "HyRISE" in script_help.stdout
 
 
-def test_process_smoke_creates_mqc_outputs(tmp_path):
+def test_process_smoke_creates_mqc_outputs(monkeypatch, tmp_path):
     input_jsons = sorted(
         (REPO_ROOT / "example_data" / "public").glob("*_NGS_results.json")
     )
     assert input_jsons
 
     out_dir = tmp_path / "process-out"
-    result = subprocess.run(
+    monkeypatch.setattr(
+        sys,
+        "argv",
         [
             "hyrise",
             "process",
@@ -41,10 +50,7 @@ def test_process_smoke_creates_mqc_outputs(tmp_path):
             "-o",
             str(out_dir),
         ],
-        check=False,
-        capture_output=True,
-        text=True,
     )
-    assert result.returncode == 0, result.stderr
+    assert cli.main() == 0
     assert any(out_dir.glob("*_mqc.json"))
     assert any(out_dir.glob("*_mqc.html"))
@@ -1,23 +1,50 @@
 import json
+import re
 from pathlib import Path
 
+import pytest
+
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 PUBLIC_DIR = REPO_ROOT / "example_data" / "public"
+# Identifiers from the original samples; one alternation scans each text once
+FORBIDDEN_TOKENS_RE = re.compile(
+    "|".join(re.escape(token) for token in ("1010_", "GEN2025", "01.01A"))
+)
+
 
+def _walk_strings(root):
+    # Iterative walk: no frame per node and no recursion limit on deep JSON.
+    # Strings come out in no particular order, which the token scan ignores.
+    stack = [root]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, str):
+            yield value
 
-def _walk_strings(value):
-    if isinstance(value, dict):
-        for nested in value.values():
-            yield from _walk_strings(nested)
-    elif isinstance(value, list):
-        for nested in value:
-            yield from _walk_strings(nested)
-    elif isinstance(value, str):
-        yield value
+
+@pytest.fixture(scope="session")
+def public_fixture_texts():
+    # Read and flatten each public fixture once; maps every file name to the
+    # text scanned for identifiers, or None for files that are not scanned
+    texts = {}
+    for path in PUBLIC_DIR.iterdir():
+        if not path.is_file():
+            continue
+        if path.suffix == ".fasta":
+            texts[path.name] = path.read_text()
+        elif path.suffix == ".json":
+            texts[path.name] = "\n".join(_walk_strings(json.loads(path.read_text())))
+        else:
+            texts[path.name] = None
+    return texts
 
 
-def test_public_fixtures_exist():
+def test_public_fixtures_exist(public_fixture_texts):
     expected = {
         "DEMO_IN_NGS.fasta",
         "DEMO_PRRT_NGS.fasta",
@@ -26,23 +53,12 @@ def test_public_fixtures_exist():
         "DEMO_PRRT_NGS_results.json",
         "DEMO_COMBO_NGS_results.json",
     }
-    present = {path.name for path in PUBLIC_DIR.iterdir() if path.is_file()}
-    assert expected.issubset(present)
-
+    assert expected.issubset(public_fixture_texts)
 
-def test_public_fixtures_do_not_contain_original_identifiers():
-    forbidden_tokens = ("1010_", "GEN2025", "01.01A")
 
-    for path in PUBLIC_DIR.iterdir():
-        if not path.is_file():
+def test_public_fixtures_do_not_contain_original_identifiers(public_fixture_texts):
+    for name, text in public_fixture_texts.items():
+        if text is None:
             continue
-
-        if path.suffix == ".fasta":
-            text = path.read_text()
-            for token in forbidden_tokens:
-                assert token not in text, f"{token} found in {path.name}"
-        elif path.suffix == ".json":
-            data = json.loads(path.read_text())
-            all_text = "\n".join(_walk_strings(data))
-            for token in forbidden_tokens:
-                assert token not in all_text, f"{token} found in {path.name}"
+        match = FORBIDDEN_TOKENS_RE.search(text)
+        assert match is None, f"{match.group(0)} found in {name}"
@@ -1,6 +1,8 @@
-import subprocess
+from pathlib import Path
 from types import SimpleNamespace
 
+import pytest
+
 import hyrise.commands.container as container_module
 import hyrise.commands.sierra as sierra_module
 
@@ -20,7 +22,7 @@ def test_sierra_smoke_native_stubbed(monkeypatch, tmp_path):
     def fake_run(cmd_parts, check):
         captured["cmd"] = cmd_parts
         output.write_text("[]")
-        return subprocess.CompletedProcess(args=cmd_parts, returncode=0)
+        return SimpleNamespace(args=cmd_parts, returncode=0)
 
     monkeypatch.setattr(sierra_module.subprocess, "run", fake_run)
 
@@ -31,26 +33,33 @@ def test_sierra_smoke_native_stubbed(monkeypatch, tmp_path):
     assert "-alignment" in captured["cmd"]
 
 
-def test_container_pull_command_deterministic(monkeypatch, tmp_path):
-    out_path = tmp_path / "hyrise.sif"
-    captured = {}
+# Runtime stubs that hold no state, so they are built once at import
+CONTAINER_STUBS = {
+    "find_singularity_binary": lambda: "/usr/bin/apptainer",
+    "verify_container": lambda *_args, **_kwargs: True,
+}
 
-    monkeypatch.setattr(
-        container_module, "find_singularity_binary", lambda: "/usr/bin/apptainer"
-    )
+
+@pytest.fixture
+def stub_container(monkeypatch):
+    # Patch the runtime lookup, pull and verification; returns the pull args
+    captured = {}
 
     def fake_pull(image_ref, output_path, singularity_path=None, force=False):
         captured["image_ref"] = image_ref
         captured["output_path"] = output_path
         captured["runtime"] = singularity_path
         captured["force"] = force
-        out_path.write_text("fake")
+        Path(output_path).write_text("fake")
         return True
 
-    monkeypatch.setattr(container_module, "pull_container_image", fake_pull)
-    monkeypatch.setattr(
-        container_module, "verify_container", lambda *_args, **_kwargs: True
-    )
+    for name, stub in {**CONTAINER_STUBS, "pull_container_image": fake_pull}.items():
+        monkeypatch.setattr(container_module, name, stub)
+    return captured
+
+
+def test_container_pull_command_deterministic(stub_container, tmp_path):
+    out_path = tmp_path / "hyrise.sif"
 
     args = SimpleNamespace(
         pull=True,
@@ -64,6 +73,6 @@ def test_container_pull_command_deterministic(monkeypatch, tmp_path):
 
     exit_code = container_module.run_container_command(args)
     assert exit_code == 0
-    assert captured["image_ref"] == "ghcr.io/phac-nml/hyrise:test"
-    assert captured["output_path"] == str(out_path.resolve())
-    assert captured["runtime"] == "/usr/bin/apptainer"
+    assert stub_container["image_ref"] == "ghcr.io/phac-nml/hyrise:test"
+    assert stub_container["output_path"] == str(out_path.resolve())
+    assert stub_container["runtime"] == "/usr/bin/apptainer"
@@ -104,15 +104,15 @@ def test_run_process_sets_report_when_multiqc(monkeypatch):
     assert called["use_container"] is None
 
 
+def _raise_boom(*args, **kwargs):
+    raise RuntimeError("boom")
+
+
 def test_run_process_exception(monkeypatch, caplog):
     # Exceptions from process_files should be caught and logged
     caplog.set_level(logging.ERROR)
     args = make_args()
-    monkeypatch.setattr(
-        cli,
-        "process_files",
-        lambda *a, **kw: (_ for _ in ()).throw(RuntimeError("boom")),
-    )
+    monkeypatch.setattr(cli, "process_files", _raise_boom)
     code = cli.run_process_command(args)
     assert code == 1
     assert "Error: boom" in caplog.text
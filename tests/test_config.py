@@ -10,15 +10,13 @@ def test_load_config_returns_empty_when_missing(monkeypatch, tmp_path):
 
 def test_load_config_from_explicit_file(tmp_path):
     cfg = tmp_path / "config.toml"
-    cfg.write_text(
-        """
-[container]
-path = "/tmp/hyrise.sif"
-runtime = "apptainer"
-
-[resources]
-dir = "/tmp/hyrise-resources"
-""".strip()
+    cfg.write_bytes(
+        b"[container]\n"
+        b'path = "/tmp/hyrise.sif"\n'
+        b'runtime = "apptainer"\n'
+        b"\n"
+        b"[resources]\n"
+        b'dir = "/tmp/hyrise-resources"\n'
     )
     loaded = config.load_config(str(cfg))
     assert loaded["container"]["path"] == "/tmp/hyrise.sif"
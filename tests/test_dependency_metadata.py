@@ -1,17 +1,17 @@
 from __future__ import annotations
 
 import ast
+import os
 import pathlib
+import pkgutil
+import re
 import sys
+import sysconfig
 
-try:
-    import tomllib
-except ModuleNotFoundError:  # pragma: no cover
-    import tomli as tomllib  # type: ignore[no-redef]
+import pytest
 
 
 REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
-PYPROJECT_PATH = REPO_ROOT / "pyproject.toml"
 SRC_ROOT = REPO_ROOT / "src" / "hyrise"
 
 
@@ -24,41 +24,98 @@ IMPORT_TO_PACKAGE = {
     "yaml": "pyyaml",
 }
 
-
-def _normalize_requirement_name(requirement: str) -> str:
-    base = requirement.split(";", 1)[0].strip()
-    if "@" in base:
-        base = base.split("@", 1)[0].strip()
-    for token in ("==", ">=", "<=", "!=", "~=", ">", "<"):
-        if token in base:
-            base = base.split(token, 1)[0].strip()
-            break
-    return base.lower().replace("_", "-")
+# Everything from the first version, URL or marker separator onwards
+REQUIREMENT_SPEC_RE = re.compile(r"\s*[<>=!~@;].*$")
 
 
-def _read_project_data() -> dict:
-    with PYPROJECT_PATH.open("rb") as handle:
-        return tomllib.load(handle)["project"]
+def _normalize_requirement_name(requirement: str) -> str:
+    return REQUIREMENT_SPEC_RE.sub("", requirement).strip().lower().replace("_", "-")
+
+
+def _stdlib_modules() -> frozenset[str]:
+    # Import roots that never need a declared dependency
+    names = getattr(sys, "stdlib_module_names", None)
+    if names is not None:
+        return frozenset(names)
+    # Python 3.9 has no stdlib_module_names, so list the stdlib directory
+    stdlib_dir = sysconfig.get_paths()["stdlib"]
+    return frozenset(sys.builtin_module_names).union(
+        module.name for module in pkgutil.iter_modules([stdlib_dir])
+    )
+
+
+def _iter_py_files(root: str):
+    # os.scandir reuses the directory entry's type info instead of a stat()
+    # per path, and never builds Path objects
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_symlink():
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_py_files(entry.path)
+            elif entry.name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                yield entry.path
+
+
+class _ImportCollector(ast.NodeVisitor):
+    """Collect top-level import names from a module's statements.
+
+    Imports are statements, so only statement lists are descended into;
+    expression subtrees, which make up most of a module, are never visited.
+    Nested statements are still covered, so lazy imports inside functions or
+    ``try`` blocks are picked up.
+    """
+
+    STATEMENT_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+    def __init__(self, imports: set[str]):
+        self.imports = imports
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for name in node.names:
+            self.imports.add(name.name.split(".", 1)[0])
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.level == 0 and node.module:
+            self.imports.add(node.module.split(".", 1)[0])
+
+    def generic_visit(self, node: ast.AST) -> None:
+        for field in self.STATEMENT_FIELDS:
+            children = getattr(node, field, None)
+            if isinstance(children, list):
+                for child in children:
+                    self.visit(child)
+
+
+def _imports_of_file(path: str) -> frozenset[str]:
+    with open(path, "rb") as handle:
+        source = handle.read()
+    # Files without the keyword cannot import anything, so skip parsing them
+    if b"import" not in source:
+        return frozenset()
+    imports: set[str] = set()
+    _ImportCollector(imports).visit(ast.parse(source, filename=path))
+    return frozenset(imports)
 
 
-def _third_party_import_roots() -> set[str]:
+def _third_party_import_roots() -> frozenset[str]:
+    stdlib_modules = _stdlib_modules()
     imports: set[str] = set()
-    stdlib = set(sys.stdlib_module_names)
+    for path in _iter_py_files(SRC_ROOT):
+        imports.update(_imports_of_file(path))
+
+    return frozenset(
+        name for name in imports if name not in stdlib_modules and name != "hyrise"
+    )
 
-    for path in SRC_ROOT.rglob("*.py"):
-        tree = ast.parse(path.read_text(), filename=str(path))
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for name in node.names:
-                    imports.add(name.name.split(".", 1)[0])
-            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
-                imports.add(node.module.split(".", 1)[0])
 
-    return {name for name in imports if name not in stdlib and name != "hyrise"}
+@pytest.fixture(scope="session")
+def third_party_import_roots():
+    # Parsing every source file is the slow part, so do it once per session
+    return _third_party_import_roots()
 
 
-def test_questionary_is_core_dependency():
-    project = _read_project_data()
+def test_questionary_is_core_dependency(project):
     dependency_names = {
         _normalize_requirement_name(requirement)
         for requirement in project["dependencies"]
@@ -66,8 +123,7 @@ def test_questionary_is_core_dependency():
     assert "questionary" in dependency_names
 
 
-def test_multiqc_is_core_dependency():
-    project = _read_project_data()
+def test_multiqc_is_core_dependency(project):
     dependency_names = {
         _normalize_requirement_name(requirement)
         for requirement in project["dependencies"]
@@ -75,28 +131,28 @@ def test_multiqc_is_core_dependency():
     assert "multiqc" in dependency_names
 
 
-def test_third_party_imports_have_declared_dependencies():
-    project = _read_project_data()
+def test_third_party_imports_have_declared_dependencies(
+    project, third_party_import_roots
+):
     all_requirements = list(project["dependencies"])
     for extra_requirements in project.get("optional-dependencies", {}).values():
         all_requirements.extend(extra_requirements)
 
     declared = {_normalize_requirement_name(req) for req in all_requirements}
-    third_party_roots = _third_party_import_roots()
 
-    missing = []
-    for import_root in sorted(third_party_roots):
-        package_name = IMPORT_TO_PACKAGE.get(import_root)
-        if package_name is None:
-            missing.append(import_root)
-            continue
-        if package_name not in declared:
-            missing.append(import_root)
+    # Unmapped import roots are never in covered, so they count as missing too
+    covered = {
+        import_root
+        for import_root, package_name in IMPORT_TO_PACKAGE.items()
+        if package_name in declared
+    }
+    missing = third_party_import_roots - covered
 
-    assert not missing, f"Missing dependency declarations for imports: {missing}"
+    assert (
+        not missing
+    ), f"Missing dependency declarations for imports: {sorted(missing)}"
 
 
-def test_package_data_includes_hivdb_xml_glob():
-    pyproject_data = tomllib.loads(PYPROJECT_PATH.read_text())
+def test_package_data_includes_hivdb_xml_glob(pyproject_data):
     package_data = pyproject_data["tool"]["setuptools"]["package-data"]["hyrise"]
     assert "HIVDB_*.xml" in package_data
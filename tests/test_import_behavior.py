@@ -1,53 +1,63 @@
 from __future__ import annotations
 
-import importlib
+import json
+import subprocess
 import sys
-from pathlib import Path
 
-try:
-    import tomllib
-except ModuleNotFoundError:  # pragma: no cover
-    import tomli as tomllib  # type: ignore[no-redef]
+import pytest
 
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
-PYPROJECT_PATH = REPO_ROOT / "pyproject.toml"
-
-
-def _purge_hyrise_modules() -> None:
-    for name in list(sys.modules):
-        if name == "hyrise" or name.startswith("hyrise."):
-            sys.modules.pop(name, None)
-
-
-def test_import_hyrise_is_lightweight_and_explicit() -> None:
-    _purge_hyrise_modules()
-
-    pkg = importlib.import_module("hyrise")
+# Runs in a fresh interpreter, so the checks see exactly what ``import hyrise``
+# loads and never touch this process's sys.modules
+IMPORT_PROBE = """
+import json
+import sys
 
-    assert isinstance(pkg.__version__, str)
-    assert pkg.__version__
-    assert pkg.__all__ == ["__version__"]
+import hyrise
+
+loaded = sorted(name for name in sys.modules if name.partition(".")[0] == "hyrise")
+namespace = {}
+exec("from hyrise import *", namespace)
+print(
+    json.dumps(
+        {
+            "version": hyrise.__version__,
+            "all": hyrise.__all__,
+            "loaded": loaded,
+            "star": sorted(name for name in namespace if name != "__builtins__"),
+        }
+    )
+)
+"""
+
+
+@pytest.fixture(scope="module")
+def import_probe():
+    # One interpreter start serves every import check in this module
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(result.stdout)
+
+
+def test_import_hyrise_is_lightweight_and_explicit(import_probe) -> None:
+    assert isinstance(import_probe["version"], str)
+    assert import_probe["version"]
+    assert import_probe["all"] == ["__version__"]
 
     # Top-level import should not eagerly import command/processing modules.
-    assert "hyrise.cli" not in sys.modules
-    assert "hyrise.core.processor" not in sys.modules
-    assert "hyrise.commands.sierra" not in sys.modules
-
-
-def test_star_import_uses_curated_public_api() -> None:
-    _purge_hyrise_modules()
-
-    namespace: dict[str, object] = {}
-    exec("from hyrise import *", namespace)
+    assert "hyrise.cli" not in import_probe["loaded"]
+    assert "hyrise.core.processor" not in import_probe["loaded"]
+    assert "hyrise.commands.sierra" not in import_probe["loaded"]
 
-    exposed = {name for name in namespace if name != "__builtins__"}
-    assert exposed == {"__version__"}
 
+def test_star_import_uses_curated_public_api(import_probe) -> None:
+    assert import_probe["star"] == ["__version__"]
 
-def test_pyproject_dynamic_version_points_to_hyrise_version() -> None:
-    with PYPROJECT_PATH.open("rb") as handle:
-        pyproject_data = tomllib.load(handle)
 
+def test_pyproject_dynamic_version_points_to_hyrise_version(pyproject_data) -> None:
     version_attr = pyproject_data["tool"]["setuptools"]["dynamic"]["version"]["attr"]
     assert version_attr == "hyrise.__version__"
@@ -7,9 +7,31 @@ from hyrise.utils.common_args import (
 )
 
 
-def test_add_container_arguments_mutually_exclusive():
+def _build_parser(add_arguments):
     parser = argparse.ArgumentParser()
-    add_container_arguments(parser)
+    add_arguments(parser)
+    return parser
+
+
+# parse_args leaves the parser untouched, so one parser per module serves
+# every case
+@pytest.fixture(scope="module")
+def container_parser():
+    return _build_parser(add_container_arguments)
+
+
+@pytest.fixture(scope="module")
+def report_parser():
+    return _build_parser(add_report_arguments)
+
+
+@pytest.fixture(scope="module")
+def visualization_parser():
+    return _build_parser(add_visualization_arguments)
+
+
+def test_add_container_arguments_mutually_exclusive(container_parser):
+    parser = container_parser
     # Collect container group args
     args = parser.parse_args([])
     # By default, neither flag
@@ -36,9 +58,8 @@ def test_add_container_arguments_mutually_exclusive():
     assert args.container_path == path
 
 
-def test_add_report_arguments_flags():
-    parser = argparse.ArgumentParser()
-    add_report_arguments(parser)
+def test_add_report_arguments_flags(report_parser):
+    parser = report_parser
     # Default
     args = parser.parse_args([])
     assert not getattr(args, "report", False)
@@ -60,9 +81,8 @@ def test_add_report_arguments_flags():
     assert args.run_multiqc is True
 
 
-def test_add_visualization_arguments_all_flags():
-    parser = argparse.ArgumentParser()
-    add_visualization_arguments(parser)
+def test_add_visualization_arguments_all_flags(visualization_parser):
+    parser = visualization_parser
     # Default
     args = parser.parse_args([])
     assert not getattr(args, "guide", False)
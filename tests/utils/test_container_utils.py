@@ -1,5 +1,5 @@
-import subprocess
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -37,17 +37,15 @@ def test_detect_container_runtime_fallback_order(monkeypatch):
     assert path == "/usr/bin/apptainer"
 
 
-def test_find_singularity_container_uses_search_paths(tmp_path):
-    first = tmp_path / "missing.sif"
-    second = tmp_path / "hyrise.sif"
-    second.write_text("ok")
+def test_find_singularity_container_uses_search_paths(dummy_container):
+    second = Path(dummy_container)
+    first = second.with_name("missing.sif")
     found = cu.find_singularity_container([str(first), str(second)])
     assert found == str(second.resolve())
 
 
-def test_run_with_singularity_builds_argv_command(tmp_path, monkeypatch):
-    container = tmp_path / "hyrise.sif"
-    container.write_text("data")
+def test_run_with_singularity_builds_argv_command(dummy_container, monkeypatch):
+    container = Path(dummy_container)
     captured = {}
 
     monkeypatch.setattr(cu, "verify_container", lambda *_args, **_kwargs: True)
@@ -55,14 +53,14 @@ def test_run_with_singularity_builds_argv_command(tmp_path, monkeypatch):
     def fake_run(cmd, check):
         captured["cmd"] = cmd
         assert check is True
-        return subprocess.CompletedProcess(args=cmd, returncode=0)
+        return SimpleNamespace(args=cmd, returncode=0)
 
     monkeypatch.setattr(cu.subprocess, "run", fake_run)
 
     result = cu.run_with_singularity(
         container_path=str(container),
         command=["sierralocal", "-o", "out.json", "input.fasta"],
-        bind_paths=[str(tmp_path)],
+        bind_paths=[str(container.parent)],
         runtime_path="/usr/bin/apptainer",
     )
 
@@ -73,20 +71,15 @@ def test_run_with_singularity_builds_argv_command(tmp_path, monkeypatch):
     assert "sierralocal" in captured["cmd"]
 
 
-def test_run_with_singularity_errors_without_runtime(tmp_path, monkeypatch):
-    container = tmp_path / "hyrise.sif"
-    container.write_text("data")
+def test_run_with_singularity_errors_without_runtime(dummy_container, monkeypatch):
     monkeypatch.setattr(
         cu, "detect_container_runtime", lambda preferred_runtime=None: (None, None)
     )
     with pytest.raises(ValueError, match="No supported container runtime found"):
-        cu.run_with_singularity(str(container), ["echo", "hello"])
+        cu.run_with_singularity(dummy_container, ["echo", "hello"])
 
 
-def test_ensure_dependencies_scopes_required_tools(tmp_path, monkeypatch):
-    container = tmp_path / "hyrise.sif"
-    container.write_text("image")
-
+def test_ensure_dependencies_scopes_required_tools(dummy_container, monkeypatch):
     monkeypatch.setattr(
         cu,
         "check_command_available",
@@ -98,7 +91,7 @@ def test_ensure_dependencies_scopes_required_tools(tmp_path, monkeypatch):
         lambda preferred_runtime=None: ("apptainer", "/usr/bin/apptainer"),
     )
     monkeypatch.setattr(
-        cu, "find_singularity_container", lambda search_paths=None: str(container)
+        cu, "find_singularity_container", lambda search_paths=None: dummy_container
     )
 
     deps = cu.ensure_dependencies(
@@ -108,7 +101,7 @@ def test_ensure_dependencies_scopes_required_tools(tmp_path, monkeypatch):
     )
 
     assert deps["runtime_name"] == "apptainer"
-    assert deps["container_path"] == str(container)
+    assert deps["container_path"] == dummy_container
     assert deps["multiqc_available"] is False
     assert deps["sierra_local_available"] is True
     assert deps["missing_dependencies"] == ["multiqc"]
@@ -1,3 +1,5 @@
+import re
+
 import pytest
 from hyrise.utils.html_utils import (
     create_html_header,
@@ -10,6 +12,12 @@ from hyrise.utils.html_utils import (
 )
 
 
+# The helpers may quote attributes with either quote style
+BAR_LABEL_RE = re.compile(r"""<div class=['"]bar-label['"]>Test</div>""")
+BAR_VALUE_RE = re.compile(r"""<div class=['"]bar-value['"]>25</div>""")
+COLOR_LEGEND_RE = re.compile(r"""<div class=['"]color-legend['"]""")
+
+
 def test_create_styled_table_default_class():
     headers = ["Col1", "Col2"]
     rows = [[1, 2], [3, 4]]
@@ -51,14 +59,8 @@ def test_create_bar_correct_width_and_label():
     # width 25% calculated
     assert "width: 25.0%;" in html
     # label and value present
-    assert (
-        "<div class='bar-label'>Test</div>" in html
-        or '<div class="bar-label">Test</div>' in html
-    )
-    assert (
-        "<div class='bar-value'>25</div>" in html
-        or '<div class="bar-value">25</div>' in html
-    )
+    assert BAR_LABEL_RE.search(html)
+    assert BAR_VALUE_RE.search(html)
 
 
 def test_create_ba():
@@ -99,7 +101,7 @@ def test_create_color_legend_no_title():
     cmap = {"One": "#111", "Two": "#222"}
     html = create_color_legend(cmap)
     # Should contain class
-    assert "<div class='color-legend'" in html or '<div class="color-legend"' in html
+    assert COLOR_LEGEND_RE.search(html)
     # Should list both labels and colors
     for label, color in cmap.items():
         assert label in html
@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 from hyrise.utils import resource_updater as ru
 
 
@@ -10,6 +12,10 @@ class _DummyResponse:
         return None
 
 
+def test_http_session_is_shared():
+    assert ru._http_session() is ru._http_session()
+
+
 def test_get_resource_dir_uses_xdg_data(monkeypatch, tmp_path):
     monkeypatch.setattr(
         ru,
@@ -34,6 +40,18 @@ def test_get_latest_resource_path_returns_highest_hivdb_version(tmp_path):
     assert latest == str(resource_dir / "HIVDB_10.1.xml")
 
 
+def test_get_latest_resource_path_ignores_symlinked_xml(tmp_path):
+    resource_dir = tmp_path / "resources"
+    resource_dir.mkdir()
+    (resource_dir / "HIVDB_9.9.xml").write_text("a")
+    outside = tmp_path / "outside.xml"
+    outside.write_text("b")
+    (resource_dir / "HIVDB_10.1.xml").symlink_to(outside)
+
+    latest = ru.get_latest_resource_path("hivdb_xml", resource_dir=str(resource_dir))
+    assert latest == str(resource_dir / "HIVDB_9.9.xml")
+
+
 def test_select_latest_hivdb_xml_ignores_nonmatching_files(tmp_path):
     resource_dir = tmp_path / "resources"
     resource_dir.mkdir()
@@ -58,7 +76,11 @@ def test_download_file_rejects_path_traversal_filename(monkeypatch, tmp_path):
     resource_dir = tmp_path / "resources"
     resource_dir.mkdir()
 
-    monkeypatch.setattr(ru.requests, "get", lambda *args, **kwargs: _DummyResponse())
+    monkeypatch.setattr(
+        ru,
+        "_http_session",
+        lambda: SimpleNamespace(get=lambda *args, **kwargs: _DummyResponse()),
+    )
 
     downloaded = ru.download_file(
         "https://example.com/file.txt",
@@ -69,6 +91,30 @@ def test_download_file_rejects_path_traversal_filename(monkeypatch, tmp_path):
     assert not (tmp_path / "outside.txt").exists()
 
 
+def test_download_file_rejects_symlinked_target(monkeypatch, tmp_path):
+    resource_dir = tmp_path / "resources"
+    resource_dir.mkdir()
+    outside = tmp_path / "outside.txt"
+    outside.write_text("original")
+    (resource_dir / "file.txt").symlink_to(outside)
+
+    monkeypatch.setattr(
+        ru,
+        "_http_session",
+        lambda: SimpleNamespace(
+            get=lambda *args, **kwargs: _DummyResponse(content=b"new")
+        ),
+    )
+
+    downloaded = ru.download_file(
+        "https://example.com/file.txt",
+        "file.txt",
+        resource_dir=str(resource_dir),
+    )
+    assert downloaded is None
+    assert outside.read_text() == "original"
+
+
 def test_update_hivdb_xml_rejects_unexpected_latest_filename(monkeypatch, tmp_path):
     resource_dir = tmp_path / "resources"
     resource_dir.mkdir()
@@ -78,7 +124,7 @@ def test_update_hivdb_xml_rejects_unexpected_latest_filename(monkeypatch, tmp_pa
             return _DummyResponse(text="../../evil.xml")
         return _DummyResponse(content=b"xml")
 
-    monkeypatch.setattr(ru.requests, "get", fake_get)
+    monkeypatch.setattr(ru, "_http_session", lambda: SimpleNamespace(get=fake_get))
 
     result = ru.update_hivdb_xml(resource_dir=str(resource_dir))
     assert result is None
@@ -126,6 +126,10 @@ def test_create_mutation_position_visualization(tmp_path, dummy_data):
     # check header and a tooltip snippet
     assert "<h3>TEST Mutation Position Map</h3>" in html
     assert "position-tooltip" in html
+    # distribution summary lists each mutation category present in the data
+    for label in ("Major Mutations", "Accessory Mutations", "SDRM Mutations"):
+        assert f"<td style='padding: 8px;'>{label}</td>" in html
+    assert "APOBEC-Mediated Mutations" in html
 
 
 def test_create_mutation_type_summary(tmp_path, dummy_data):